@@ -73,11 +73,11 @@ async def create_order(
     if final_order_obj.driver_association:
         response_data['driver_info'] = TransportManagerResponse.model_validate(final_order_obj.driver_association).model_dump()
     if final_order_obj.vehicle:
-        response_data['vehicle_info'] = VehicleResponse.model_validate(final_order_obj.vehicle).model_dump()
+        response_data['vehicle_info'] = VehicleResponse.from_orm_fast(final_order_obj.vehicle).model_dump()
     if final_order_obj.transport_company:
         response_data['transport_company'] = TransportCompanyResponse.model_validate(final_order_obj.transport_company).model_dump()
     if final_order_obj.waste_records:
-        response_data['waste_records'] = [WasteRecordResponse.model_validate(wr).model_dump() for wr in final_order_obj.waste_records]
+        response_data['waste_records'] = [WasteRecordResponse.from_orm_fast(wr).model_dump() for wr in final_order_obj.waste_records]
     if final_order_obj.payments:
         response_data['payments'] = [PaymentResponse.model_validate(p).model_dump() for p in final_order_obj.payments]
 
@@ -179,7 +179,6 @@ async def read_order(
         joinedload(Order.address).joinedload(Address.community),
         joinedload(Order.transport_company),
         joinedload(Order.driver_association).joinedload(TransportManager.manager), # Eager load driver's user details
-        joinedload(Order.driver_association).joinedload(TransportManager.vehicle_assignments), # If driver has direct vehicle link
         joinedload(Order.vehicle),
         joinedload(Order.recycling_company), # Assuming RecyclingCompany relationship exists
         joinedload(Order.waste_records).joinedload(WasteRecord.recorded_by_user),
@@ -263,11 +262,11 @@ async def read_order(
     if order.driver_association:
         response_data['driver_info'] = TransportManagerResponse.model_validate(order.driver_association).model_dump()
     if order.vehicle:
-        response_data['vehicle_info'] = VehicleResponse.model_validate(order.vehicle).model_dump()
+        response_data['vehicle_info'] = VehicleResponse.from_orm_fast(order.vehicle).model_dump()
     if order.transport_company:
         response_data['transport_company'] = TransportCompanyResponse.model_validate(order.transport_company).model_dump()
     if order.waste_records:
-        response_data['waste_records'] = [WasteRecordResponse.model_validate(wr).model_dump() for wr in order.waste_records]
+        response_data['waste_records'] = [WasteRecordResponse.from_orm_fast(wr).model_dump() for wr in order.waste_records]
     if order.payments:
         response_data['payments'] = [PaymentResponse.model_validate(p).model_dump() for p in order.payments]
     # Add similar for recycling_company if needed in response schema explicitly
@@ -534,11 +533,11 @@ async def update_order_status(
     if final_order_obj.driver_association:
         response_data['driver_info'] = TransportManagerResponse.model_validate(final_order_obj.driver_association).model_dump()
     if final_order_obj.vehicle:
-        response_data['vehicle_info'] = VehicleResponse.model_validate(final_order_obj.vehicle).model_dump()
+        response_data['vehicle_info'] = VehicleResponse.from_orm_fast(final_order_obj.vehicle).model_dump()
     if final_order_obj.transport_company:
         response_data['transport_company'] = TransportCompanyResponse.model_validate(final_order_obj.transport_company).model_dump()
     if final_order_obj.waste_records:
-        response_data['waste_records'] = [WasteRecordResponse.model_validate(wr).model_dump() for wr in final_order_obj.waste_records]
+        response_data['waste_records'] = [WasteRecordResponse.from_orm_fast(wr).model_dump() for wr in final_order_obj.waste_records]
     if final_order_obj.payments:
         response_data['payments'] = [PaymentResponse.model_validate(p).model_dump() for p in final_order_obj.payments]
     
@@ -618,11 +617,11 @@ async def update_order(
     if final_order_obj.driver_association:
         response_data['driver_info'] = TransportManagerResponse.model_validate(final_order_obj.driver_association).model_dump()
     if final_order_obj.vehicle:
-        response_data['vehicle_info'] = VehicleResponse.model_validate(final_order_obj.vehicle).model_dump()
+        response_data['vehicle_info'] = VehicleResponse.from_orm_fast(final_order_obj.vehicle).model_dump()
     if final_order_obj.transport_company:
         response_data['transport_company'] = TransportCompanyResponse.model_validate(final_order_obj.transport_company).model_dump()
     if final_order_obj.waste_records:
-        response_data['waste_records'] = [WasteRecordResponse.model_validate(wr).model_dump() for wr in final_order_obj.waste_records]
+        response_data['waste_records'] = [WasteRecordResponse.from_orm_fast(wr).model_dump() for wr in final_order_obj.waste_records]
     if final_order_obj.payments:
         response_data['payments'] = [PaymentResponse.model_validate(p).model_dump() for p in final_order_obj.payments]
     return response_data
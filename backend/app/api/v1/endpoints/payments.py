@@ -1,6 +1,7 @@
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
 from datetime import datetime
 
 from app.api.deps import get_current_active_user # For user initiating payment
@@ -9,6 +10,7 @@ from app.models.user import User, UserRole
 from app.models.order import Order, OrderStatus
 from app.models.payment import Payment, PaymentStatus as PaymentStatusEnum, PaymentMethod as PaymentMethodEnum
 from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse, PaymentStatus, PaymentMethod
+from app.schemas.adapters import PaymentListAdapter
 from app.crud import crud_payment, crud_order
 
 router = APIRouter()
@@ -86,7 +88,8 @@ async def list_payments_for_order(
     """List all payment records associated with a specific order."""
     await check_order_payment_permission(db, order_id, current_user, allow_customer=True)
     payments = crud_payment.payment.get_by_order_id(db, order_id=order_id)
-    return [PaymentResponse.model_validate(payment).model_dump() for payment in payments]
+    rows = PaymentListAdapter.validate_python(payments, from_attributes=True)
+    return PaymentListAdapter.dump_python(rows, mode="json", by_alias=True)
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
 async def read_payment(
@@ -181,7 +184,15 @@ async def manually_update_payment_status(
     if not order:
          raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order associated with payment not found")
 
-    update_data = status_update.model_dump(exclude_unset=True)
+    # 结合数据库中的当前状态校验状态流转
+    try:
+        status_update = PaymentUpdate.model_validate(
+            status_update.model_dump(exclude_unset=True), context={"current_status": payment.status}
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.errors()[0]["msg"])
+
+    update_data = status_update.model_dump(mode="python", exclude_unset=True)
     
     # If status is being updated, especially to SUCCESSFUL or REFUNDED, set relevant timestamps
     new_status_val = update_data.get("status")
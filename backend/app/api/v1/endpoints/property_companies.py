@@ -8,6 +8,7 @@ from app.models.user import User, UserRole
 from app.models.property_company import PropertyCompany
 from app.schemas.property_company import PropertyCompanyCreate, PropertyCompanyUpdate, PropertyCompanyResponse
 from app.schemas.property_manager import PropertyManagerCreate # For auto-assigning primary manager
+from app.schemas.adapters import PropertyCompanyListAdapter
 from app.crud import crud_property_company, crud_property_manager, crud_user # crud_user for checking if user exists
 
 router = APIRouter()
@@ -33,7 +34,7 @@ async def create_property_company(
 
     # 使用 crud_property_company 中的 create_with_primary_manager
     company = crud_property_company.property_company.create_with_primary_manager(
-        db=db, obj_in=company_in, primary_manager_user_id=current_user.id
+        db=db, obj_in=company_in, manager_user_id=current_user.id
     )
     return PropertyCompanyResponse.model_validate(company).model_dump()
 
@@ -57,7 +58,7 @@ async def read_property_companies(
         # companies = crud_property_company.property_company.get_multi_active(db, skip=skip, limit=limit)
         # For now, restrict to superuser and property role users for listing
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权查看物业公司列表")
-    return [PropertyCompanyResponse.model_validate(c).model_dump() for c in companies]
+    return PropertyCompanyListAdapter.dump_python([PropertyCompanyResponse.from_orm_trusted(c) for c in companies], mode="json", by_alias=True)
 
 @router.get("/{company_id}", response_model=PropertyCompanyResponse)
 async def read_property_company(
@@ -124,7 +125,7 @@ async def delete_property_company(
     db: Session = Depends(get_db),
     company_id: int,
     current_user: User = Depends(get_current_active_user)
-) -> Any:
+) -> None:
     """删除物业公司。"""
     if not current_user.is_superuser:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only superusers can delete property companies.")
@@ -134,5 +135,5 @@ async def delete_property_company(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property company not found.")
 
     # Consider cascade delete implications (managers, communities)
-    deleted_company = crud_property_company.property_company.remove(db, id=company_id)
-    return deleted_company 
\ No newline at end of file
+    crud_property_company.property_company.remove(db, id=company_id)
+    return 
\ No newline at end of file
@@ -14,10 +14,14 @@ from app.schemas.recycling_company import (
     RecyclingCompanyStatusUpdate
 )
 # We will need RecyclingManager CRUD and schemas for manager operations, but not directly in company CRUD
+from app.schemas.adapters import RecyclingCompanyListAdapter
 from app.crud import crud_recycling_company, crud_recycling_manager, crud_user 
 
 router = APIRouter()
 
+# 查询参数中的公司类型查表转换，避免靠抛出 ValueError 判断非法值
+_COMPANY_TYPE_BY_VALUE = {t.value: t for t in RecyclingCompanyType}
+
 @router.post("/", response_model=RecyclingCompanyResponse, status_code=status.HTTP_201_CREATED)
 async def create_recycling_company(
     *,
@@ -55,11 +59,10 @@ async def read_recycling_companies(
         if active_only:
             companies = crud_recycling_company.recycling_company.get_active_companies(db, skip=skip, limit=limit)
         elif company_type:
-            try:
-                type_enum = RecyclingCompanyType(company_type)
-                companies = crud_recycling_company.recycling_company.get_by_company_type(db, company_type=type_enum, skip=skip, limit=limit)
-            except ValueError:
+            type_enum = _COMPANY_TYPE_BY_VALUE.get(company_type)
+            if type_enum is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"无效的回收公司类型: {company_type}")
+            companies = crud_recycling_company.recycling_company.get_by_company_type(db, company_type=type_enum, skip=skip, limit=limit)
         else:
             companies = crud_recycling_company.recycling_company.get_multi(db, skip=skip, limit=limit)
     elif current_user.role == UserRole.RECYCLING:
@@ -71,17 +74,15 @@ async def read_recycling_companies(
         if active_only:
             companies = [c for c in companies if c.status == RecyclingCompanyStatus.ACTIVE and c.is_active]
         if company_type:
-            try:
-                type_enum = RecyclingCompanyType(company_type)
+            type_enum = _COMPANY_TYPE_BY_VALUE.get(company_type)
+            # 非法类型不做过滤，与之前的行为一致
+            if type_enum is not None:
                 companies = [c for c in companies if c.company_type == type_enum]
-            except ValueError:
-                 # Should not happen if type_enum is validated before, but as a safeguard
-                pass 
     else:
         # Public view: perhaps only active companies
         # companies = crud_recycling_company.recycling_company.get_active_companies(db, skip=skip, limit=limit)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权查看回收公司列表")
-    return [RecyclingCompanyResponse.model_validate(c).model_dump() for c in companies]
+    return RecyclingCompanyListAdapter.dump_python([RecyclingCompanyResponse.from_orm_trusted(c) for c in companies], mode="json", by_alias=True)
 
 @router.get("/{company_id}", response_model=RecyclingCompanyResponse)
 async def read_recycling_company(
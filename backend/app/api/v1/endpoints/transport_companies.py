@@ -8,6 +8,7 @@ from app.models.user import User, UserRole
 from app.models.transport_company import TransportCompany
 from app.schemas.transport_company import TransportCompanyCreate, TransportCompanyUpdate, TransportCompanyResponse
 from app.schemas.transport_manager import TransportManagerCreate, TransportManagerResponse # For adding managers
+from app.schemas.adapters import TransportCompanyListAdapter
 from app.crud import crud_transport_company, crud_transport_manager, crud_user # crud_user for checking if user exists
 
 router = APIRouter()
@@ -55,7 +56,7 @@ async def read_transport_companies(
         companies = crud_transport_company.transport_company.get_by_manager_user(
             db, manager_user_id=current_user.id, skip=skip, limit=limit
         )
-    return [TransportCompanyResponse.model_validate(c).model_dump() for c in companies]
+    return TransportCompanyListAdapter.dump_python([TransportCompanyResponse.from_orm_trusted(c) for c in companies], mode="json", by_alias=True)
 
 @router.get("/{company_id}", response_model=TransportCompanyResponse)
 async def read_transport_company(
@@ -100,7 +101,7 @@ async def delete_transport_company(
     db: Session = Depends(get_db),
     company_id: int,
     current_user: User = Depends(get_current_active_user)
-) -> Any:
+) -> None:
     """删除运输公司。"""
     if not current_user.is_superuser:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only superusers can delete transport companies.")
@@ -110,8 +111,8 @@ async def delete_transport_company(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transport company not found.")
 
     # Consider what happens to orders, managers, vehicles associated. Cascade delete set on models?
-    deleted_company = crud_transport_company.transport_company.remove(db, id=company_id)
-    return deleted_company
+    crud_transport_company.transport_company.remove(db, id=company_id)
+    return
 
 # Endpoints for managing managers (drivers, dispatchers) within a company will be in transport_managers.py (or here if preferred)
 # For now, keeping company-specific personnel management separate for clarity, similar to properties.py vs property_managers.py logic. 
\ No newline at end of file
@@ -82,7 +82,7 @@ async def register_user(
     
     # 默认注册为普通用户，管理员和其他角色需要超级管理员创建
     if user_in.role not in [UserRole.CUSTOMER]:
-        user_in.role = UserRole.CUSTOMER
+        user_in = user_in.model_copy(update={"role": UserRole.CUSTOMER})
     
     user_obj = user.create(db, obj_in=user_in)
     return user_obj
@@ -122,7 +122,8 @@ async def read_users(
 ) -> Any:
     """获取所有用户列表（仅限超级管理员）"""
     users = user.get_multi(db, skip=skip, limit=limit)
-    return users
+    # 可信的 ORM 数据跳过校验构建响应模型
+    return [UserResponse.from_orm_fast(obj) for obj in users]
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
@@ -79,7 +79,7 @@ async def list_vehicles_for_company(
         vehicles = crud_vehicle.vehicle.get_vehicles_by_status(db, transport_company_id=company_id, status=status_filter)
     else:
         vehicles = crud_vehicle.vehicle.get_by_transport_company(db, transport_company_id=company_id)
-    return vehicles
+    return [VehicleResponse.from_orm_fast(obj) for obj in vehicles]
 
 @router.get("/{vehicle_id}", response_model=VehicleResponse)
 async def get_vehicle_details(
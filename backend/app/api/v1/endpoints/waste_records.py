@@ -67,7 +67,7 @@ async def create_waste_record(
     )
     # Eager load user for response
     reloaded_record = crud_waste_record.waste_record.get_with_user(db, id=record.id)
-    return WasteRecordResponse.model_validate(reloaded_record).model_dump() if reloaded_record else None # Return None or raise error if not found
+    return WasteRecordResponse.from_orm_fast(reloaded_record).model_dump() if reloaded_record else None # Return None or raise error if not found
 
 
 @router.get("/order/{order_id}", response_model=List[WasteRecordResponse])
@@ -82,7 +82,7 @@ async def list_waste_records_for_order(
     """
     await check_order_waste_record_permission(db, order_id, current_user)
     records = crud_waste_record.waste_record.get_by_order_id(db, order_id=order_id)
-    return records
+    return [WasteRecordResponse.from_orm_fast(obj) for obj in records]
 
 
 @router.get("/{record_id}", response_model=WasteRecordResponse)
@@ -100,7 +100,7 @@ async def read_waste_record(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Waste record not found")
     
     await check_order_waste_record_permission(db, record.order_id, current_user)
-    return WasteRecordResponse.model_validate(record).model_dump()
+    return WasteRecordResponse.from_orm_fast(record).model_dump()
 
 
 @router.put("/{record_id}", response_model=WasteRecordResponse)
@@ -131,7 +131,7 @@ async def update_waste_record(
 
     updated_record_db = crud_waste_record.waste_record.update(db, db_obj=db_record, obj_in=update_data)
     reloaded_updated_record = crud_waste_record.waste_record.get_with_user(db, id=updated_record_db.id)
-    return WasteRecordResponse.model_validate(reloaded_updated_record).model_dump() if reloaded_updated_record else None # Re-fetch with user for response
+    return WasteRecordResponse.from_orm_fast(reloaded_updated_record).model_dump() if reloaded_updated_record else None # Re-fetch with user for response
 
 
 @router.delete("/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     # 安全配置
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60*24*8))  # 8天
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))  # 测试环境可调低以加快哈希
     
     # 数据库配置
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./waste_transport.db")
@@ -1,3 +1,5 @@
+import functools
+from calendar import timegm
 from datetime import datetime, timedelta
 from typing import Any, Union
 
@@ -6,7 +8,8 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 模块级只构建一次，轮数由配置决定
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 DEFAULT_ALGORITHM = "HS256"
 
@@ -18,9 +21,12 @@ def create_access_token(
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=DEFAULT_ALGORITHM)
-    return encoded_jwt
+    # JWT 的 exp 精度为秒，同一秒内为同一用户签发的令牌完全相同，可直接复用
+    return _sign(str(subject), timegm(expire.utctimetuple()))
+
+@functools.lru_cache(maxsize=1024)
+def _sign(subject: str, exp: int) -> str:
+    return jwt.encode({"exp": exp, "sub": subject}, settings.SECRET_KEY, algorithm=DEFAULT_ALGORITHM)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """验证密码"""
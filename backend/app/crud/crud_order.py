@@ -1,5 +1,5 @@
 from typing import Any, Dict, Optional, Union, List
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi.encoders import jsonable_encoder
 import datetime
 import uuid
@@ -10,8 +10,18 @@ from app.models.property_manager import PropertyManager
 from app.models.address import Address
 from app.models.community import Community
 from app.models.transport_manager import TransportManager
+from app.models.waste_record import WasteRecord
 from app.schemas.order import OrderCreate, OrderUpdate
 
+# 列表接口按 OrderResponse 序列化时会访问的关系，一并预加载，避免逐行懒加载 (N+1)
+# 一对多关系用 selectinload，不受 offset/limit 影响，也不会让主查询的行数膨胀
+_LIST_OPTIONS = (
+    joinedload(Order.address).joinedload(Address.community),
+    joinedload(Order.transport_company),
+    selectinload(Order.waste_records).joinedload(WasteRecord.recorded_by_user),
+    selectinload(Order.payments),
+)
+
 class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
     def get_by_order_number(self, db: Session, *, order_number: str) -> Optional[Order]:
         """根据订单编号获取订单"""
@@ -22,7 +32,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         query = db.query(Order).filter(Order.customer_id == customer_id)
         if status:
             query = query.filter(Order.status == status)
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def get_by_property_manager(
         self, db: Session, *, manager_user_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None
@@ -72,21 +82,21 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         if status:
             query = query.filter(Order.status == status)
         
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def get_by_transport_manager(self, db: Session, *, manager_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[Order]:
         """获取运输管理员负责的所有订单"""
         query = db.query(Order).filter(Order.transport_manager_id == manager_id)
         if status:
             query = query.filter(Order.status == status)
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def get_by_recycling_manager(self, db: Session, *, manager_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[Order]:
         """获取回收站管理员负责的所有订单"""
         query = db.query(Order).filter(Order.recycling_manager_id == manager_id)
         if status:
             query = query.filter(Order.status == status)
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def get_by_driver(self, db: Session, *, driver_manager_assoc_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[Order]:
         """获取司机负责的所有订单 (通过 TransportManager.id)"""
@@ -95,8 +105,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         if status:
             query = query.filter(Order.status == status)
         return query.options(
-            joinedload(Order.address).joinedload(Address.community),
-            joinedload(Order.transport_company),
+            *_LIST_OPTIONS,
             joinedload(Order.vehicle)
         ).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
@@ -106,7 +115,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         if status:
             query = query.filter(Order.status == status)
         return query.options(
-            joinedload(Order.address).joinedload(Address.community),
+            *_LIST_OPTIONS,
             joinedload(Order.driver_association).joinedload(TransportManager.manager), # Load driver's user details
             joinedload(Order.vehicle)
         ).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
@@ -116,11 +125,11 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         query = db.query(Order).filter(Order.recycling_company_id == recycling_company_id)
         if status:
             query = query.filter(Order.status == status)
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def get_by_status(self, db: Session, *, status: str, skip: int = 0, limit: int = 100) -> List[Order]:
         """根据状态获取订单"""
-        return db.query(Order).filter(Order.status == status).options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return db.query(Order).filter(Order.status == status).options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
     
     def update_status(self, db: Session, *, db_obj: Order, status: str, **kwargs) -> Order:
         """更新订单状态"""
@@ -160,6 +169,6 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         query = db.query(self.model)
         if status:
             query = query.filter(Order.status == status)
-        return query.options(joinedload(Order.address).joinedload(Address.community)).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+        return query.options(*_LIST_OPTIONS).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
 
 order = CRUDOrder(Order)
\ No newline at end of file
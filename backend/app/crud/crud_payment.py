@@ -9,7 +9,7 @@ from app.schemas.payment import PaymentCreate, PaymentUpdate
 class CRUDPayment(CRUDBase[Payment, PaymentCreate, PaymentUpdate]):
     def create_for_order(self, db: Session, *, obj_in: PaymentCreate, order_id: int) -> Payment:
         """为指定订单创建支付记录。"""
-        create_data = obj_in.model_dump()
+        create_data = obj_in.model_dump(mode="python")
         create_data['order_id'] = order_id # Ensure order_id is correct
         
         # Potentially set default status if not provided, though model has default
@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 
 from app.crud.base import CRUDBase
@@ -10,6 +10,22 @@ from app.schemas.property_company import PropertyCompanyCreate, PropertyCompanyU
 class CRUDPropertyCompany(CRUDBase[PropertyCompany, PropertyCompanyCreate, PropertyCompanyUpdate]): # 重命名类
     """物业公司CRUD操作""" # 更新描述
     
+    def get_by_name(self, db: Session, *, name: str) -> Optional[PropertyCompany]:
+        """根据名称获取物业公司"""
+        return db.query(PropertyCompany).filter(PropertyCompany.name == name).first()
+
+    def get_with_managers_and_communities(self, db: Session, *, id: int) -> Optional[PropertyCompany]:
+        """获取物业公司，并预加载管理员 (及其小区) 和小区列表"""
+        return (
+            db.query(PropertyCompany)
+            .options(
+                joinedload(PropertyCompany.property_managers).joinedload(PropertyManager.community),
+                joinedload(PropertyCompany.communities),
+            )
+            .filter(PropertyCompany.id == id)
+            .first()
+        )
+
     def create_with_primary_manager(
         self, db: Session, *, obj_in: PropertyCompanyCreate, manager_user_id: int
     ) -> PropertyCompany:
@@ -29,9 +45,20 @@ class CRUDPropertyCompany(CRUDBase[PropertyCompany, PropertyCompanyCreate, Prope
             is_primary=True
         )
         db.add(manager_assoc)
+        company_id = db_obj.id # 提交后对象过期，先取出ID，避免为它单独查询
         db.commit()
-        db.refresh(db_obj) # 刷新物业公司对象以包含关系
-        return db_obj
+        # 刷新物业公司对象以包含关系：响应会序列化管理员 (及其小区) 和小区列表，
+        # 新建的公司只有一名管理员且没有小区，一条 JOIN 查询即可带回，不再逐个懒加载
+        return (
+            db.query(PropertyCompany)
+            .options(
+                joinedload(PropertyCompany.property_managers).joinedload(PropertyManager.community),
+                joinedload(PropertyCompany.communities),
+            )
+            .populate_existing()
+            .filter(PropertyCompany.id == company_id)
+            .one()
+        )
     
     def get_by_manager_user(
         self, db: Session, *, manager_user_id: int, skip: int = 0, limit: int = 100
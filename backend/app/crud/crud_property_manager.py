@@ -1,8 +1,10 @@
 from typing import Any, Dict, Optional, Union, List
-from sqlalchemy.orm import Session
+from sqlalchemy import case, or_, update
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 
 from app.crud.base import CRUDBase
+from app.models.community import Community
 from app.models.property_manager import PropertyManager
 from app.schemas.property_manager import PropertyManagerCreate, PropertyManagerUpdate
 
@@ -48,17 +50,17 @@ class CRUDPropertyManager(CRUDBase[PropertyManager, PropertyManagerCreate, Prope
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.model_dump(exclude_unset=True)
+            update_data = obj_in.model_dump(mode="python", exclude_unset=True)
 
+        # 合并数据库当前值后再校验，部分更新时未传入的字段以现有记录为准
         is_primary_final = update_data.get("is_primary", db_obj.is_primary)
         community_id_final = update_data.get("community_id", db_obj.community_id)
 
         if is_primary_final is False and community_id_final is None:
-            if not update_data.get("role"):
-                raise HTTPException(
-                    status_code=400,
-                    detail="非主要管理员必须关联一个小区。"
-                )
+            raise HTTPException(
+                status_code=400,
+                detail="非主要管理员必须关联一个小区。"
+            )
 
         if is_primary_final is True:
             update_data["community_id"] = None
@@ -75,6 +77,39 @@ class CRUDPropertyManager(CRUDBase[PropertyManager, PropertyManagerCreate, Prope
 
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
+    def set_primary(self, db: Session, *, db_obj: PropertyManager, demoted_community_id: int) -> PropertyManager:
+        """
+        将 db_obj 设为主要管理员，原主要管理员降级并关联到 demoted_community_id。
+        一条 UPDATE 同时完成降级和提升，公司在任何时刻都只有一个主要管理员
+        """
+        community = db.get(Community, demoted_community_id)
+        if community is None or community.property_company_id != db_obj.property_company_id:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Community {demoted_community_id} does not belong to property company {db_obj.property_company_id}."
+            )
+
+        db.execute(
+            update(PropertyManager)
+            .where(
+                PropertyManager.property_company_id == db_obj.property_company_id,
+                or_(PropertyManager.id == db_obj.id, PropertyManager.is_primary == True),
+            )
+            .values(
+                is_primary=(PropertyManager.id == db_obj.id),
+                community_id=case((PropertyManager.id == db_obj.id, None), else_=demoted_community_id),
+            )
+        )
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def get_with_details(self, db: Session, *, id: int) -> Optional[PropertyManager]:
+        """获取物业管理员关联记录，并预加载关联的小区"""
+        return db.query(PropertyManager).options(
+            joinedload(PropertyManager.community)
+        ).filter(PropertyManager.id == id).first()
+
     def get_by_property_company_and_manager_user(
         self, db: Session, *, property_company_id: int, manager_user_id: int
     ) -> Optional[PropertyManager]:
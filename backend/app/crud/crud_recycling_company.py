@@ -36,7 +36,7 @@ class CRUDRecyclingCompany(CRUDBase[RecyclingCompany, RecyclingCompanyCreate, Re
     
     def update_company_status(self, db: Session, *, db_obj: RecyclingCompany, status_in: RecyclingCompanyStatusUpdate) -> RecyclingCompany:
         """更新回收公司运营状态和可选的当前负载"""
-        update_data = status_in.model_dump(exclude_unset=True)
+        update_data = status_in.model_dump(mode="python", exclude_unset=True)
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
     def update_current_load(self, db: Session, *, db_obj: RecyclingCompany, additional_load: float) -> RecyclingCompany:
@@ -67,7 +67,7 @@ class CRUDRecyclingManager(CRUDBase[RecyclingManager, RecyclingManagerCreate, Re
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.model_dump(exclude_unset=True)
+            update_data = obj_in.model_dump(mode="python", exclude_unset=True)
 
         # If attempting to set as primary, and it was not primary before, check if another primary manager exists
         if update_data.get("is_primary") is True and not db_obj.is_primary:
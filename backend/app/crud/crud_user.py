@@ -46,7 +46,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
+            update_data = obj_in.model_dump(mode="python", exclude_unset=True)
         
         # 如果更新包含密码，则需要哈希处理
         if update_data.get("password"):
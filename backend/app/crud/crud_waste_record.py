@@ -13,7 +13,7 @@ class CRUDWasteRecord(CRUDBase[WasteRecord, WasteRecordCreate, WasteRecordUpdate
         创建废物记录，关联到订单和可选的记录用户。
         注意: obj_in.order_id 应该与参数 order_id 一致，这里我们信任调用者或在API层校验。
         """
-        create_data = obj_in.model_dump()
+        create_data = obj_in.model_dump(mode="python")
         create_data['order_id'] = order_id # Ensure order_id is correctly set
         if user_id:
             create_data['recorded_by_user_id'] = user_id
@@ -1,7 +1,15 @@
 # 导入所有模型，以便Alembic可以自动检测
 from app.db.base_class import Base
 from app.models.user import User
+from app.models.property_company import PropertyCompany
+from app.models.property_manager import PropertyManager
+from app.models.community import Community
+from app.models.address import Address
 from app.models.order import Order
-from app.models.property import Property
-from app.models.transport import Transport
-from app.models.recycling import Recycling
\ No newline at end of file
+from app.models.transport_company import TransportCompany
+from app.models.transport_manager import TransportManager
+from app.models.vehicle import Vehicle
+from app.models.recycling_company import RecyclingCompany
+from app.models.recycling_manager import RecyclingManager
+from app.models.waste_record import WasteRecord
+from app.models.payment import Payment
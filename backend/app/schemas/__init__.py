@@ -16,6 +16,12 @@ from .recycling_manager import RecyclingManagerBase, RecyclingManagerCreate, Rec
 from .waste_record import WasteRecordBase, WasteRecordCreate, WasteRecordUpdate, WasteRecordResponse
 from .payment import PaymentBase, PaymentCreate, PaymentUpdate, PaymentResponse, PaymentMethod, PaymentStatus # 新增
 
+# 嵌套响应模型使用前向引用，全部导入后统一构建一次
+PropertyManagerResponse.model_rebuild()
+PropertyCompanyResponse.model_rebuild()
+TransportCompanyResponse.model_rebuild()
+OrderResponse.model_rebuild()
+
 __all__ = [
     "UserBase", "UserCreate", "UserUpdate", "UserResponse", "UserRole", "Token", "TokenPayload",
     "PropertyCompanyBase", "PropertyCompanyCreate", "PropertyCompanyUpdate", "PropertyCompanyResponse",
@@ -0,0 +1,21 @@
+# 各 schema 共用的字段描述文本
+
+ASSOC_ID = "关联ID"
+USER_ID = "用户ID"
+MANAGER_USER_ID = "管理员用户ID"
+ORDER_ID = "关联的订单ID"
+COMMUNITY_ID = "关联的小区ID"
+PROPERTY_COMPANY_ID = "所属物业公司ID"
+TRANSPORT_COMPANY_ID = "所属运输公司ID"
+RECYCLING_COMPANY_ID = "所属回收公司ID"
+
+COMPANY_ADDRESS = "公司地址"
+CONTACT_NAME = "联系人姓名"
+CONTACT_PHONE = "联系电话"
+EMAIL = "电子邮箱"
+DESCRIPTION = "描述信息"
+
+IS_ACTIVE = "是否激活"
+IS_PRIMARY = "是否为主要管理员"
+CREATED_AT = "创建时间"
+UPDATED_AT = "更新时间"
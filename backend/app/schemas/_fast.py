@@ -0,0 +1,24 @@
+from functools import lru_cache
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _scalar_fields(model: Type[BaseModel], relations: Tuple[str, ...]) -> Tuple[str, ...]:
+    # 除关系字段外的字段名，每个模型只计算一次
+    return tuple(name for name in model.model_fields if name not in relations)
+
+
+def from_orm_trusted(model: Type[M], obj: Any, **relations: Callable[[Any], Any]) -> M:
+    """跳过校验，从已预加载关系的 ORM 对象构建响应
+
+    relations 为关系字段名到单个元素构建函数的映射；关系列表直接传入，避免 default_factory 再分配空列表
+    """
+    scalars = _scalar_fields(model, tuple(relations))
+    return model.model_construct(
+        **{name: getattr(obj, name) for name in scalars},
+        **{name: [build(item) for item in (getattr(obj, name, None) or ())] for name, build in relations.items()},
+    )
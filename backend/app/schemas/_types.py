@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional, Annotated
+from datetime import datetime
+from pydantic import Field
+from . import _descriptions as desc
+
+# Update 模型中常用的可选字段类型，共享同一份 FieldInfo
+OptStr = Annotated[Optional[str], Field(None)]
+OptInt = Annotated[Optional[int], Field(None)]
+OptFloat = Annotated[Optional[float], Field(None)]
+OptBool = Annotated[Optional[bool], Field(None)]
+OptDT = Annotated[Optional[datetime], Field(None)]
+
+# 请求模型 (Create/Update) 中的长文本字段。上限只加在请求模型上，响应模型仍用 Optional[str]，
+# 数据库中已有的超长旧数据照常返回
+LongText = Annotated[Optional[str], Field(None, max_length=1000)]
+
+# 响应模型通用时间戳字段
+CreatedAt = Annotated[datetime, Field(description=desc.CREATED_AT)]
+UpdatedAt = Annotated[datetime, Field(description=desc.UPDATED_AT)]
+
+
+def field_docs(docs: Dict[str, str]):
+    """生成 json_schema_extra 钩子，只在生成 OpenAPI 时补充字段描述"""
+    def _apply(schema: Dict[str, Any], model: Any) -> None:
+        for name, prop in schema.get("properties", {}).items():
+            if name in docs:
+                prop.setdefault("description", docs[name])
+    return _apply
+
+
+def enum_lookup(table: Dict[str, Any]):
+    """生成 BeforeValidator 用的查表函数，非字符串或未命中时原样交给枚举校验"""
+    def _lookup(v: Any) -> Any:
+        return table.get(v, v) if isinstance(v, str) else v
+    return _lookup
@@ -0,0 +1,16 @@
+from typing import List
+from pydantic import TypeAdapter
+
+# 通过包导入，确保前向引用已完成 model_rebuild
+from app.schemas import (
+    PaymentResponse,
+    PropertyCompanyResponse,
+    RecyclingCompanyResponse,
+    TransportCompanyResponse,
+)
+
+# 列表接口复用的 TypeAdapter，模块加载时构建一次
+PropertyCompanyListAdapter = TypeAdapter(List[PropertyCompanyResponse])
+TransportCompanyListAdapter = TypeAdapter(List[TransportCompanyResponse])
+RecyclingCompanyListAdapter = TypeAdapter(List[RecyclingCompanyResponse])
+PaymentListAdapter = TypeAdapter(List[PaymentResponse])
@@ -1,16 +1,17 @@
 from typing import Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import CreatedAt, UpdatedAt
+from . import _descriptions as desc
 from .community import CommunityResponse
 
 class AddressBase(BaseModel):
     """地址基础模型"""
     address: str = Field(..., description="详细街道地址，例如xx路xx号")
-    community_id: int = Field(..., description="关联的小区ID")
+    community_id: int = Field(..., description=desc.COMMUNITY_ID)
     building_number: str = Field(..., description="楼栋号")
     room_number: str = Field(..., description="房间号")
-    contact_name: str = Field(..., description="联系人姓名")
-    contact_phone: str = Field(..., description="联系电话")
+    contact_name: str = Field(..., description=desc.CONTACT_NAME)
+    contact_phone: str = Field(..., description=desc.CONTACT_PHONE)
     label: Optional[str] = Field(None, description="地址标签，如家、公司")
     is_default: bool = Field(False, description="是否为默认地址")
     notes: Optional[str] = Field(None, description="备注")
@@ -22,11 +23,11 @@ class AddressCreate(AddressBase):
 class AddressUpdate(BaseModel):
     """更新地址模型"""
     address: Optional[str] = Field(None, description="详细街道地址")
-    community_id: Optional[int] = Field(None, description="关联的小区ID")
+    community_id: Optional[int] = Field(None, description=desc.COMMUNITY_ID)
     building_number: Optional[str] = Field(None, description="楼栋号")
     room_number: Optional[str] = Field(None, description="房间号")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
+    contact_name: Optional[str] = Field(None, description=desc.CONTACT_NAME)
+    contact_phone: Optional[str] = Field(None, description=desc.CONTACT_PHONE)
     label: Optional[str] = Field(None, description="地址标签")
     is_default: Optional[bool] = Field(None, description="是否为默认地址")
     notes: Optional[str] = Field(None, description="备注")
@@ -36,8 +37,7 @@ class AddressResponse(AddressBase):
     id: int
     user_id: int
     community: Optional[CommunityResponse] = Field(None, description="关联的小区详细信息")
-    created_at: datetime
-    updated_at: datetime
+    created_at: CreatedAt
+    updated_at: UpdatedAt
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
\ No newline at end of file
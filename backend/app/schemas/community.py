@@ -1,6 +1,7 @@
 from typing import Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import CreatedAt, UpdatedAt
+from . import _descriptions as desc
 
 # 基础模型
 class CommunityBase(BaseModel):
@@ -8,7 +9,7 @@ class CommunityBase(BaseModel):
     name: str = Field(..., description="社区名称")
     address: str = Field(..., description="社区地址")
     description: Optional[str] = Field(None, description="社区描述")
-    is_active: bool = Field(True, description="是否激活")
+    is_active: bool = Field(True, description=desc.IS_ACTIVE)
 
 # 创建模型
 class CommunityCreate(CommunityBase):
@@ -21,15 +22,14 @@ class CommunityUpdate(BaseModel):
     name: Optional[str] = Field(None, description="社区名称")
     address: Optional[str] = Field(None, description="社区地址")
     description: Optional[str] = Field(None, description="社区描述")
-    is_active: Optional[bool] = Field(None, description="是否激活")
+    is_active: Optional[bool] = Field(None, description=desc.IS_ACTIVE)
 
 # 响应模型
 class CommunityResponse(CommunityBase):
     """社区响应模型"""
     id: int = Field(..., description="社区ID")
-    property_company_id: int = Field(..., description="所属物业公司ID")
-    created_at: datetime = Field(..., description="创建时间")
-    updated_at: datetime = Field(..., description="更新时间")
+    property_company_id: int = Field(..., description=desc.PROPERTY_COMPANY_ID)
+    created_at: CreatedAt
+    updated_at: UpdatedAt
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
\ No newline at end of file
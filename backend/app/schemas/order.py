@@ -1,6 +1,7 @@
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import CreatedAt, UpdatedAt
 from enum import Enum
 from .address import AddressResponse
 from .transport_company import TransportCompanyResponse
@@ -124,8 +125,8 @@ class OrderResponse(OrderBase):
     
     # 订单状态和时间
     status: OrderStatus
-    created_at: datetime
-    updated_at: datetime
+    created_at: CreatedAt
+    updated_at: UpdatedAt
     
     # 费用信息
     price: float
@@ -140,5 +141,4 @@ class OrderResponse(OrderBase):
     waste_records: Optional[List[WasteRecordResponse]] = Field(None, description="关联的废物记录") # 处置回收信息实际填写的废物信息
     payments: Optional[List[PaymentResponse]] = Field(None, description="关联的支付记录")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
\ No newline at end of file
@@ -1,30 +1,30 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, ValidationInfo, model_validator
+from pydantic_core import PydanticCustomError
+from ._types import LongText, OptDT, field_docs
+from . import _descriptions as desc
 
-# 从模型导入枚举，以便在 schema 中使用和校验
-from app.models.payment import PaymentMethod as PaymentMethodEnum
-from app.models.payment import PaymentStatus as PaymentStatusEnum
+# 枚举直接复用模型定义，不在 schema 中重复声明
+from app.models.payment import PaymentMethod, PaymentStatus
 
-
-class PaymentMethod(str, Enum):
-    CREDIT_CARD = "credit_card"
-    ALIPAY = "alipay"
-    WECHAT_PAY = "wechat_pay"
-    BANK_TRANSFER = "bank_transfer"
-    CASH = "cash"
-
-class PaymentStatus(str, Enum):
-    PENDING = "pending"
-    PROCESSING = "processing"
-    SUCCESSFUL = "successful"
-    FAILED = "failed"
-    REFUNDED = "refunded"
-    CANCELLED = "cancelled"
+# 允许的支付状态流转 (当前状态, 目标状态)
+_VALID_PAYMENT_TRANSITIONS: frozenset[tuple[PaymentStatus, PaymentStatus]] = frozenset({
+    (PaymentStatus.PENDING, PaymentStatus.PROCESSING),
+    (PaymentStatus.PENDING, PaymentStatus.SUCCESSFUL),
+    (PaymentStatus.PENDING, PaymentStatus.FAILED),
+    (PaymentStatus.PENDING, PaymentStatus.CANCELLED),
+    (PaymentStatus.PROCESSING, PaymentStatus.SUCCESSFUL),
+    (PaymentStatus.PROCESSING, PaymentStatus.FAILED),
+    (PaymentStatus.PROCESSING, PaymentStatus.CANCELLED),
+    (PaymentStatus.SUCCESSFUL, PaymentStatus.REFUNDED),
+    (PaymentStatus.FAILED, PaymentStatus.PENDING),
+})
 
 # 支付记录基础模型
 class PaymentBase(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
     amount: float = Field(..., gt=0, description="支付金额")
     currency: str = Field("CNY", description="货币单位")
     payment_method: Optional[PaymentMethod] = Field(None, description="支付方式")
@@ -33,28 +33,48 @@ class PaymentBase(BaseModel):
 
 # 创建支付记录模型
 class PaymentCreate(PaymentBase):
-    order_id: int = Field(..., description="关联的订单ID")
+    currency: str = Field("CNY", min_length=3, max_length=3, description="货币单位")
+    notes: LongText = Field(None, description="支付备注")
+    order_id: PositiveInt = Field(..., description=desc.ORDER_ID)
     # status is PENDING by default in model
     # transaction_id might be set after creation or during update by gateway callback
 
 # 更新支付记录模型 (主要用于更新状态、交易ID等)
 class PaymentUpdate(BaseModel):
+    model_config = ConfigDict(json_schema_extra=field_docs({
+        "paid_at": "支付成功时间",
+        "refunded_at": "退款时间",
+    }))
+
     payment_method: Optional[PaymentMethod] = Field(None, description="支付方式")
-    transaction_id: Optional[str] = Field(None, description="支付网关交易ID")
+    transaction_id: Optional[str] = Field(None, max_length=128, description="支付网关交易ID")
     status: Optional[PaymentStatus] = Field(None, description="支付状态")
-    paid_at: Optional[datetime] = Field(None, description="支付成功时间")
-    refunded_at: Optional[datetime] = Field(None, description="退款时间")
-    notes: Optional[str] = Field(None, description="支付备注")
+    paid_at: OptDT = None
+    refunded_at: OptDT = None
+    notes: LongText = Field(None, description="支付备注")
+
+    @model_validator(mode='after')
+    def check_status_transition(self, info: ValidationInfo) -> 'PaymentUpdate':
+        """校验支付状态流转，当前状态通过 context={"current_status": ...} 传入"""
+        current_status = (info.context or {}).get("current_status")
+        if self.status is None or current_status is None or self.status == current_status:
+            return self
+        if (current_status, self.status) not in _VALID_PAYMENT_TRANSITIONS:
+            raise PydanticCustomError(
+                'invalid_status_transition',
+                '不允许的支付状态变更: {current} -> {target}',
+                {'current': PaymentStatus(current_status).value, 'target': self.status.value},
+            )
+        return self
 
 # 支付记录响应模型
 class PaymentResponse(PaymentBase):
-    id: int = Field(..., description="支付记录ID")
-    order_id: int = Field(..., description="关联的订单ID")
+    id: PositiveInt = Field(..., description="支付记录ID")
+    order_id: PositiveInt = Field(..., description=desc.ORDER_ID)
     status: PaymentStatus = Field(..., description="支付状态")
     transaction_id: Optional[str] = Field(None, description="支付网关交易ID")
     initiated_at: datetime = Field(..., description="支付发起时间")
     paid_at: Optional[datetime] = Field(None, description="支付成功时间")
     refunded_at: Optional[datetime] = Field(None, description="退款时间")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
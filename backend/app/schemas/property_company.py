@@ -1,45 +1,68 @@
-from typing import Optional, List
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Optional, List, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import LongText, OptStr, OptBool, CreatedAt, UpdatedAt, field_docs
+from ._fast import from_orm_trusted
+from . import _descriptions as desc
 
-from app.schemas.community import CommunityResponse
-from app.schemas.property_manager import PropertyManagerResponse # Assuming this is already updated if needed
+# 嵌套响应模型延迟导入，由 app.schemas 统一 model_rebuild
+if TYPE_CHECKING:
+    from app.schemas.community import CommunityResponse
+    from app.schemas.property_manager import PropertyManagerResponse
 
 # 共享属性
 class PropertyCompanyBase(BaseModel):
     """物业公司基础模型""" # 更新描述
     name: str = Field(..., description="物业公司名称")
     address: str = Field(..., description="物业公司地址")
-    contact_name: str = Field(..., description="联系人姓名")
-    contact_phone: str = Field(..., description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
+    contact_name: str = Field(..., description=desc.CONTACT_NAME)
+    contact_phone: str = Field(..., description=desc.CONTACT_PHONE)
+    email: Optional[str] = Field(None, description=desc.EMAIL)
+    description: Optional[str] = Field(None, description=desc.DESCRIPTION)
 
 # 创建时需要的属性
 class PropertyCompanyCreate(PropertyCompanyBase):
     """创建物业公司模型""" # 更新描述
-    pass
+    description: LongText = Field(None, description=desc.DESCRIPTION)
 
 # 更新时可以修改的属性
 class PropertyCompanyUpdate(BaseModel):
     """更新物业公司模型""" # 更新描述
-    name: Optional[str] = Field(None, description="物业公司名称")
-    address: Optional[str] = Field(None, description="物业公司地址")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
-    is_active: Optional[bool] = Field(None, description="是否激活")
+    model_config = ConfigDict(json_schema_extra=field_docs({
+        "name": "物业公司名称",
+        "address": "物业公司地址",
+        "contact_name": desc.CONTACT_NAME,
+        "contact_phone": desc.CONTACT_PHONE,
+        "email": desc.EMAIL,
+        "description": desc.DESCRIPTION,
+        "is_active": desc.IS_ACTIVE,
+    }))
+
+    name: OptStr = None
+    address: OptStr = None
+    contact_name: OptStr = None
+    contact_phone: OptStr = None
+    email: OptStr = None
+    description: LongText = None
+    is_active: OptBool = None
 
 # API响应模型
 class PropertyCompanyResponse(PropertyCompanyBase):
     """物业公司响应模型""" # 更新描述
     id: int = Field(..., description="物业公司ID") # 更新描述
-    is_active: bool = Field(..., description="是否激活")
-    created_at: datetime = Field(..., description="创建时间")
-    updated_at: datetime = Field(..., description="更新时间")
-    property_managers: List[PropertyManagerResponse] = Field(default_factory=list, description="物业管理人员列表") # 更新描述
-    communities: List[CommunityResponse] = Field(default_factory=list, description="管理的社区列表")
+    is_active: bool = Field(..., description=desc.IS_ACTIVE)
+    created_at: CreatedAt
+    updated_at: UpdatedAt
+    property_managers: List["PropertyManagerResponse"] = Field(default_factory=list, description="物业管理人员列表") # 更新描述
+    communities: List["CommunityResponse"] = Field(default_factory=list, description="管理的社区列表")
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "PropertyCompanyResponse":
+        from app.schemas.community import CommunityResponse
+        from app.schemas.property_manager import PropertyManagerResponse
+        return from_orm_trusted(
+            cls, obj,
+            property_managers=PropertyManagerResponse.model_validate,
+            communities=CommunityResponse.model_validate,
+        )
@@ -1,6 +1,9 @@
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import LongText, OptStr, OptFloat, OptBool, OptDT, CreatedAt, UpdatedAt, field_docs
+from ._fast import from_orm_trusted
+from . import _descriptions as desc
 
 # 从 model 导入枚举
 from app.models.recycling_company import RecyclingCompanyType, RecyclingCompanyStatus
@@ -11,12 +14,14 @@ from .recycling_manager import RecyclingManagerResponse
 # 共享属性
 class RecyclingCompanyBase(BaseModel):
     """回收公司基础模型"""
+    model_config = ConfigDict(use_enum_values=True)
+
     name: str = Field(..., description="回收公司名称")
-    address: Optional[str] = Field(None, description="公司地址")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
+    address: Optional[str] = Field(None, description=desc.COMPANY_ADDRESS)
+    contact_name: Optional[str] = Field(None, description=desc.CONTACT_NAME)
+    contact_phone: Optional[str] = Field(None, description=desc.CONTACT_PHONE)
+    email: Optional[str] = Field(None, description=desc.EMAIL)
+    description: Optional[str] = Field(None, description=desc.DESCRIPTION)
     
     company_type: RecyclingCompanyType = Field(RecyclingCompanyType.CONSTRUCTION, description="回收公司类型")
     status: RecyclingCompanyStatus = Field(RecyclingCompanyStatus.ACTIVE, description="公司运营状态")
@@ -29,26 +34,41 @@ class RecyclingCompanyBase(BaseModel):
 # 创建时需要的属性
 class RecyclingCompanyCreate(RecyclingCompanyBase):
     """创建回收公司模型"""
-    pass
+    description: LongText = Field(None, description=desc.DESCRIPTION)
 
 # 更新时可以修改的属性
 class RecyclingCompanyUpdate(BaseModel):
     """更新回收公司模型"""
-    name: Optional[str] = Field(None, description="回收公司名称")
-    address: Optional[str] = Field(None, description="公司地址")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
+    model_config = ConfigDict(json_schema_extra=field_docs({
+        "name": "回收公司名称",
+        "address": desc.COMPANY_ADDRESS,
+        "contact_name": desc.CONTACT_NAME,
+        "contact_phone": desc.CONTACT_PHONE,
+        "email": desc.EMAIL,
+        "description": desc.DESCRIPTION,
+        "capacity_tons_per_day": "设计日处理能力（吨/天）",
+        "current_load_tons": "当前库存或负载（吨）",
+        "operation_hours": "运营时间",
+        "license_number": "经营许可证号",
+        "license_expiry_date": "许可证到期日期",
+        "is_active": desc.IS_ACTIVE,
+    }))
+
+    name: OptStr = None
+    address: OptStr = None
+    contact_name: OptStr = None
+    contact_phone: OptStr = None
+    email: OptStr = None
+    description: LongText = None
     
     company_type: Optional[RecyclingCompanyType] = Field(None, description="回收公司类型")
     status: Optional[RecyclingCompanyStatus] = Field(None, description="公司运营状态")
-    capacity_tons_per_day: Optional[float] = Field(None, description="设计日处理能力（吨/天）")
-    current_load_tons: Optional[float] = Field(None, description="当前库存或负载（吨）")
-    operation_hours: Optional[str] = Field(None, description="运营时间")
-    license_number: Optional[str] = Field(None, description="经营许可证号")
-    license_expiry_date: Optional[datetime] = Field(None, description="许可证到期日期")
-    is_active: Optional[bool] = Field(None, description="是否激活")
+    capacity_tons_per_day: OptFloat = None
+    current_load_tons: OptFloat = None
+    operation_hours: OptStr = None
+    license_number: OptStr = None
+    license_expiry_date: OptDT = None
+    is_active: OptBool = None
 
 # 单独为回收站状态更新创建一个简单的 Schema
 class RecyclingCompanyStatusUpdate(BaseModel):
@@ -59,12 +79,15 @@ class RecyclingCompanyStatusUpdate(BaseModel):
 class RecyclingCompanyResponse(RecyclingCompanyBase):
     """回收公司响应模型"""
     id: int = Field(..., description="回收公司ID")
-    is_active: bool = Field(..., description="是否激活")
-    created_at: datetime = Field(..., description="创建时间")
-    updated_at: datetime = Field(..., description="更新时间")
+    is_active: bool = Field(..., description=desc.IS_ACTIVE)
+    created_at: CreatedAt
+    updated_at: UpdatedAt
     
     # 关系
     recycling_managers: List[RecyclingManagerResponse] = Field(default_factory=list, description="回收公司管理人员列表")
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "RecyclingCompanyResponse":
+        return from_orm_trusted(cls, obj, recycling_managers=RecyclingManagerResponse.model_validate)
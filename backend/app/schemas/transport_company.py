@@ -1,48 +1,70 @@
-from typing import Optional, List
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Optional, List, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field
+from ._types import LongText, OptStr, OptBool, CreatedAt, UpdatedAt, field_docs
+from ._fast import from_orm_trusted
+from . import _descriptions as desc
 
-# 导入 TransportManager 和 Vehicle 的响应模型
-from .transport_manager import TransportManagerResponse 
-from .vehicle import VehicleResponse
+# TransportManager 和 Vehicle 的响应模型延迟导入，由 app.schemas 统一 model_rebuild
+if TYPE_CHECKING:
+    from .transport_manager import TransportManagerResponse
+    from .vehicle import VehicleResponse
 
 # 共享属性
 class TransportCompanyBase(BaseModel):
     """运输公司基础模型"""
     name: str = Field(..., description="运输公司名称")
-    address: Optional[str] = Field(None, description="公司地址")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
+    address: Optional[str] = Field(None, description=desc.COMPANY_ADDRESS)
+    contact_name: Optional[str] = Field(None, description=desc.CONTACT_NAME)
+    contact_phone: Optional[str] = Field(None, description=desc.CONTACT_PHONE)
+    email: Optional[str] = Field(None, description=desc.EMAIL)
+    description: Optional[str] = Field(None, description=desc.DESCRIPTION)
 
 # 创建时需要的属性
 class TransportCompanyCreate(TransportCompanyBase):
     """创建运输公司模型"""
-    pass
+    description: LongText = Field(None, description=desc.DESCRIPTION)
 
 # 更新时可以修改的属性
 class TransportCompanyUpdate(BaseModel):
     """更新运输公司模型"""
-    name: Optional[str] = Field(None, description="运输公司名称")
-    address: Optional[str] = Field(None, description="公司地址")
-    contact_name: Optional[str] = Field(None, description="联系人姓名")
-    contact_phone: Optional[str] = Field(None, description="联系电话")
-    email: Optional[str] = Field(None, description="电子邮箱")
-    description: Optional[str] = Field(None, description="描述信息")
-    is_active: Optional[bool] = Field(None, description="是否激活")
+    model_config = ConfigDict(json_schema_extra=field_docs({
+        "name": "运输公司名称",
+        "address": desc.COMPANY_ADDRESS,
+        "contact_name": desc.CONTACT_NAME,
+        "contact_phone": desc.CONTACT_PHONE,
+        "email": desc.EMAIL,
+        "description": desc.DESCRIPTION,
+        "is_active": desc.IS_ACTIVE,
+    }))
+
+    name: OptStr = None
+    address: OptStr = None
+    contact_name: OptStr = None
+    contact_phone: OptStr = None
+    email: OptStr = None
+    description: LongText = None
+    is_active: OptBool = None
 
 # API响应模型
 class TransportCompanyResponse(TransportCompanyBase):
     """运输公司响应模型"""
     id: int = Field(..., description="运输公司ID")
-    is_active: bool = Field(..., description="是否激活")
-    created_at: datetime = Field(..., description="创建时间")
-    updated_at: datetime = Field(..., description="更新时间")
+    is_active: bool = Field(..., description=desc.IS_ACTIVE)
+    created_at: CreatedAt
+    updated_at: UpdatedAt
     
     # 关系
-    transport_managers: List[TransportManagerResponse] = Field(default_factory=list, description="运输公司管理人员列表")
-    vehicles: List[VehicleResponse] = Field(default_factory=list, description="运输公司车辆列表")
+    transport_managers: List["TransportManagerResponse"] = Field(default_factory=list, description="运输公司管理人员列表")
+    vehicles: List["VehicleResponse"] = Field(default_factory=list, description="运输公司车辆列表")
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
-    class Config:
-        from_attributes = True # Pydantic V2 orm_mode 替换为 from_attributes 
\ No newline at end of file
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "TransportCompanyResponse":
+        from .transport_manager import TransportManagerResponse
+        from .vehicle import VehicleResponse
+        return from_orm_trusted(
+            cls, obj,
+            transport_managers=TransportManagerResponse.model_validate,
+            vehicles=VehicleResponse.from_orm_fast,
+        )
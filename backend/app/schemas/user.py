@@ -1,11 +1,47 @@
-from typing import Optional, List, Any
-from pydantic import BaseModel, EmailStr, validator
+import re
+from typing import Annotated, Any, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainValidator, PositiveInt, WithJsonSchema, field_serializer
+from pydantic.networks import validate_email
+from email_validator import SPECIAL_USE_DOMAIN_NAMES
 from app.models.user import UserRole
+from ._types import enum_lookup
+
+# 角色取值到枚举的映射，避免每次校验都遍历枚举
+_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+# 序列化时枚举到字符串的映射
+_ROLE_TO_STR = {role: role.value for role in UserRole}
+
+# 解析阶段先查表转换角色，未命中的值交给枚举校验报错
+RoleField = Annotated[UserRole, BeforeValidator(enum_lookup(_ROLE_BY_VALUE))]
+
+# 常见 ASCII 邮箱直接用正则判定，其余交给 email-validator
+# 域名每段最长 63 个字符；第 3、4 位为 "--" 的段（如 xn-- 开头的 punycode）需要 IDNA 校验，不走快路径
+_EMAIL_FAST = re.compile(
+    r"^[A-Za-z0-9_%+\-]+(?:\.[A-Za-z0-9_%+\-]+)*"
+    r"@(?:(?![A-Za-z0-9]{2}--)[A-Za-z0-9](?:[A-Za-z0-9\-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}$"
+)
+# email-validator 拒绝的特殊用途顶级域名，走慢路径以保持一致
+_SPECIAL_USE_TLDS = frozenset(d.rsplit(".", 1)[-1] for d in SPECIAL_USE_DOMAIN_NAMES)
+
+def _validate_email(v: Any) -> str:
+    if isinstance(v, str) and len(v) <= 254 and _EMAIL_FAST.match(v):
+        local, _, domain = v.rpartition("@")
+        domain = domain.lower()
+        if len(local) <= 64 and domain.rsplit(".", 1)[-1] not in _SPECIAL_USE_TLDS:
+            # 与 email-validator 一致，域名部分统一小写
+            return f"{local}@{domain}"
+    return validate_email(v)[1]
+
+EmailField = Annotated[
+    str,
+    PlainValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
 
 # 共享属性基类
 class UserBase(BaseModel):
     username: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     phone: Optional[str] = None
     full_name: Optional[str] = None
     role: Optional[str] = None
@@ -15,29 +51,44 @@ class UserBase(BaseModel):
 
 # 创建用户时需要的属性
 class UserCreate(UserBase):
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
     username: str
     phone: str
     password: str
-    role: str = UserRole.CUSTOMER
-    
-    @validator('role')
-    def validate_role(cls, v):
-        if v not in [role.value for role in UserRole]:
-            raise ValueError(f'角色必须是以下之一: {[role.value for role in UserRole]}')
-        return v
+    role: RoleField = UserRole.CUSTOMER
 
 # 更新用户时可以更新的属性
 class UserUpdate(UserBase):
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
     full_name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     password: Optional[str] = None
+    role: Optional[RoleField] = None
 
-# API响应中的用户信息
-class UserResponse(UserBase):
-    id: int
+# API响应中的用户信息 (不继承 UserBase，字段直接展开)
+class UserResponse(BaseModel):
+    username: Optional[str] = None
+    email: Optional[EmailField] = None
+    phone: Optional[str] = None
+    full_name: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = True
+    is_superuser: Optional[bool] = False
+    wx_openid: Optional[str] = None
+    id: PositiveInt
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @field_serializer("role")
+    def _serialize_role(self, v: Optional[str]) -> Optional[str]:
+        return _ROLE_TO_STR.get(v, v)
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "UserResponse":
+        """直接从可信的 ORM 对象构建，跳过校验"""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
 
 # 存储在令牌中的用户信息
 class UserInDB(UserResponse):
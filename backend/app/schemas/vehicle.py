@@ -1,50 +1,95 @@
-from typing import Optional, List
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
-from enum import Enum
+from typing import Annotated, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_serializer
+from ._types import CreatedAt, UpdatedAt, enum_lookup, field_docs
+from . import _descriptions as desc
 
 # 从 model 中导入枚举，确保一致性
 from app.models.vehicle import VehicleType, VehicleStatus
 
+# 序列化时枚举到字符串的映射
+_VEHICLE_TYPE_TO_STR = {t: t.value for t in VehicleType}
+_VEHICLE_STATUS_TO_STR = {s: s.value for s in VehicleStatus}
+# 解析时字符串到枚举的映射
+_VEHICLE_TYPE_BY_VALUE = {t.value: t for t in VehicleType}
+_VEHICLE_STATUS_BY_VALUE = {s.value: s for s in VehicleStatus}
+
+# 解析阶段先查表转换枚举，未命中的值交给枚举校验报错
+VehicleTypeField = Annotated[VehicleType, BeforeValidator(enum_lookup(_VEHICLE_TYPE_BY_VALUE))]
+VehicleStatusField = Annotated[VehicleStatus, BeforeValidator(enum_lookup(_VEHICLE_STATUS_BY_VALUE))]
+
+# 字段描述只用于 OpenAPI，不挂在 FieldInfo 上
+_FIELD_DOCS = {
+    "plate_number": "车牌号",
+    "vehicle_type": "车辆类型",
+    "model_name": "车辆型号",
+    "purchase_year": "购置年份",
+    "capacity_tons": "额定载重量 (吨)",
+    "volume_cubic_meters": "额定容积 (立方米)",
+    "status": "车辆当前状态",
+    "notes": "备注信息",
+    "is_active": desc.IS_ACTIVE,
+}
+
 # 车辆基础模型
 class VehicleBase(BaseModel):
     """车辆基础模型"""
-    plate_number: str = Field(..., description="车牌号")
-    vehicle_type: VehicleType = Field(VehicleType.MEDIUM, description="车辆类型")
-    model_name: Optional[str] = Field(None, description="车辆型号")
-    purchase_year: Optional[int] = Field(None, description="购置年份")
-    capacity_tons: Optional[float] = Field(None, description="额定载重量 (吨)")
-    volume_cubic_meters: Optional[float] = Field(None, description="额定容积 (立方米)")
-    status: VehicleStatus = Field(VehicleStatus.AVAILABLE, description="车辆当前状态")
-    notes: Optional[str] = Field(None, description="备注信息")
+    model_config = ConfigDict(json_schema_extra=field_docs(_FIELD_DOCS))
+
+    plate_number: str
+    vehicle_type: VehicleTypeField = VehicleType.MEDIUM
+    model_name: Optional[str] = None
+    purchase_year: Optional[int] = None
+    capacity_tons: Optional[float] = None
+    volume_cubic_meters: Optional[float] = None
+    status: VehicleStatusField = VehicleStatus.AVAILABLE
+    notes: Optional[str] = None
 
 # 创建车辆模型
 class VehicleCreate(VehicleBase):
     """创建车辆模型"""
-    transport_company_id: int = Field(..., description="所属运输公司ID")
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False, str_strip_whitespace=True)
+
+    transport_company_id: int = Field(..., description=desc.TRANSPORT_COMPANY_ID)
 
 # 更新车辆模型
 class VehicleUpdate(BaseModel):
     """更新车辆模型"""
-    plate_number: Optional[str] = Field(None, description="车牌号")
-    vehicle_type: Optional[VehicleType] = Field(None, description="车辆类型")
-    model_name: Optional[str] = Field(None, description="车辆型号")
-    purchase_year: Optional[int] = Field(None, description="购置年份")
-    capacity_tons: Optional[float] = Field(None, description="额定载重量 (吨)")
-    volume_cubic_meters: Optional[float] = Field(None, description="额定容积 (立方米)")
-    status: Optional[VehicleStatus] = Field(None, description="车辆当前状态")
-    notes: Optional[str] = Field(None, description="备注信息")
-    is_active: Optional[bool] = Field(None, description="是否激活")
+    model_config = ConfigDict(
+        extra="ignore", frozen=True, validate_assignment=False, str_strip_whitespace=True,
+        json_schema_extra=field_docs(_FIELD_DOCS),
+    )
+
+    plate_number: Optional[str] = None
+    vehicle_type: Optional[VehicleTypeField] = None
+    model_name: Optional[str] = None
+    purchase_year: Optional[int] = None
+    capacity_tons: Optional[float] = None
+    volume_cubic_meters: Optional[float] = None
+    status: Optional[VehicleStatusField] = None
+    notes: Optional[str] = None
+    is_active: Optional[bool] = None
     # transport_company_id: Optional[int] = Field(None, description="所属运输公司ID (一般不建议修改)")
 
 # 车辆响应模型
 class VehicleResponse(VehicleBase):
     """车辆响应模型"""
     id: int = Field(..., description="车辆ID")
-    transport_company_id: int = Field(..., description="所属运输公司ID")
-    is_active: bool = Field(..., description="是否激活")
-    created_at: datetime = Field(..., description="创建时间")
-    updated_at: datetime = Field(..., description="更新时间")
+    transport_company_id: int = Field(..., description=desc.TRANSPORT_COMPANY_ID)
+    is_active: bool = Field(..., description=desc.IS_ACTIVE)
+    created_at: CreatedAt
+    updated_at: UpdatedAt
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @field_serializer("vehicle_type")
+    def _serialize_vehicle_type(self, v: VehicleType) -> str:
+        return _VEHICLE_TYPE_TO_STR.get(v, v)
+
+    @field_serializer("status")
+    def _serialize_status(self, v: VehicleStatus) -> str:
+        return _VEHICLE_STATUS_TO_STR.get(v, v)
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    @classmethod
+    def from_orm_fast(cls, obj) -> "VehicleResponse":
+        """直接从可信的 ORM 对象构建，跳过校验"""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
@@ -1,37 +1,63 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from . import _descriptions as desc
+from ._types import field_docs
 
 from app.schemas.user import UserResponse # For embedding user info in response
 
+# 字段描述只用于 OpenAPI，不挂在 FieldInfo 上
+_FIELD_DOCS = {
+    "waste_type_actual": "实际废物类型",
+    "waste_volume_actual": "实际废物体积 (立方米)",
+    "waste_weight_actual": "实际废物重量 (吨)",
+    "processing_method": "处理方法",
+    "processing_notes": "处理备注",
+    "processed_at": "处理完成时间",
+    "image_url": "废物照片URL",
+    "recorded_by_user_id": "记录人用户ID",
+}
+
 # 废物记录基础模型
 class WasteRecordBase(BaseModel):
-    waste_type_actual: Optional[str] = Field(None, description="实际废物类型")
-    waste_volume_actual: Optional[float] = Field(None, description="实际废物体积 (立方米)")
-    waste_weight_actual: Optional[float] = Field(None, description="实际废物重量 (吨)")
-    processing_method: Optional[str] = Field(None, description="处理方法")
-    processing_notes: Optional[str] = Field(None, description="处理备注")
-    processed_at: Optional[datetime] = Field(None, description="处理完成时间")
-    image_url: Optional[str] = Field(None, description="废物照片URL")
-    recorded_by_user_id: Optional[int] = Field(None, description="记录人用户ID")
+    model_config = ConfigDict(json_schema_extra=field_docs(_FIELD_DOCS))
+
+    waste_type_actual: Optional[str] = None
+    waste_volume_actual: Optional[float] = None
+    waste_weight_actual: Optional[float] = None
+    processing_method: Optional[str] = None
+    processing_notes: Optional[str] = None
+    processed_at: Optional[datetime] = None
+    image_url: Optional[str] = None
+    recorded_by_user_id: Optional[int] = None
 
 # 创建废物记录模型
 class WasteRecordCreate(WasteRecordBase):
-    order_id: int = Field(..., description="关联的订单ID")
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False, str_strip_whitespace=True)
+
+    order_id: int = Field(..., description=desc.ORDER_ID)
     # recorded_by_user_id will be set based on the current user performing the action typically
 
 # 更新废物记录模型
 class WasteRecordUpdate(WasteRecordBase):
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False, str_strip_whitespace=True)
+
     # All fields are optional for update
-    pass
 
 # 废物记录响应模型
 class WasteRecordResponse(WasteRecordBase):
     id: int = Field(..., description="废物记录ID")
-    order_id: int = Field(..., description="关联的订单ID")
+    order_id: int = Field(..., description=desc.ORDER_ID)
     recorded_at: datetime = Field(..., description="记录创建时间")
     last_updated_at: datetime = Field(..., description="记录更新时间")
     recorded_by_user: Optional[UserResponse] = Field(None, description="记录人用户信息")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "WasteRecordResponse":
+        """直接从可信的 ORM 对象构建，跳过校验；model_construct 不递归，嵌套用户单独构建"""
+        data = {name: getattr(obj, name) for name in cls.model_fields if name != "recorded_by_user"}
+        recorded_by_user = getattr(obj, "recorded_by_user", None)
+        data["recorded_by_user"] = UserResponse.from_orm_fast(recorded_by_user) if recorded_by_user is not None else None
+        return cls.model_construct(**data)
@@ -1,43 +1,233 @@
+import contextlib
+import functools
+import itertools
+import os
+
+# 必须在导入应用之前设置，security 模块在导入时读取轮数
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from pydantic import BaseModel
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+from app.core.security import create_access_token, get_password_hash
 from app.db.base import Base
-from app.db.session import get_db
+from app.api import deps
+from app.db import session as db_session
+from app.models.user import User, UserRole
 from main import app
 
-# 使用SQLite内存数据库进行测试
-SQLALCHEMY_DATABASE_URL = "sqlite:///./waste_transport.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# pytest-xdist 下的 worker 标识，用于生成不重复的测试数据
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+# SQLite内存数据库，StaticPool 让所有连接共用同一个底层连接（即同一个库）
+# 内存库属于各自进程，xdist 的 worker 之间天然隔离
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 
-@pytest.fixture(scope="function")
-def db():
-    # 创建测试数据库表
+# 测试库不需要持久性：临时表/排序也放在内存里，关闭同步
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+# pysqlite 默认的事务处理会延迟/隐式提交事务，改为由 SQLAlchemy 显式发出 BEGIN，保证外层事务可以完整回滚
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transaction(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+def pytest_configure(config):
+    # 收集测试前一次性补全仍有未解析前向引用的 schema，避免在首个测试中构建
+    import app.schemas as schemas
+    for obj in vars(schemas).values():
+        if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel and not obj.__pydantic_complete__:
+            obj.model_rebuild()
+
+@pytest.fixture(scope="session")
+def db_engine():
+    # 整个测试会话只建一次表
     Base.metadata.create_all(bind=engine)
-    
-    # 创建数据库会话
-    db = TestingSessionLocal()
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="function")
+def db(db_engine):
+    # 每个测试运行在外层事务中，测试结束时整体回滚
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    # rollback_only：CRUD 和测试代码里的 commit 只 flush，不再为每次 commit 发出 SAVEPOINT/RELEASE
+    # 准备数据阶段频繁 commit，不让对象在每次 commit 后过期重新查询
+    db = Session(bind=connection, autoflush=False, expire_on_commit=False, join_transaction_mode="rollback_only")
+    # rollback_only 没有 SAVEPOINT 提供的局部回滚：任何 rollback (显式调用或 flush 失败) 都会回滚整个外层事务，
+    # 之后的写入不再隔离。记录下来，让依赖 rollback 的测试直接失败，而不是悄悄污染其他测试
+    rollbacks = []
+    event.listen(db, "after_soft_rollback", lambda session, previous_transaction: rollbacks.append(previous_transaction))
+
     try:
         yield db
     finally:
         db.close()
-    
-    # 清理测试数据库
-    Base.metadata.drop_all(bind=engine)
+        # 回滚外层事务，数据库恢复到测试前状态
+        transaction.rollback()
+        connection.close()
+    if rollbacks:
+        pytest.fail("测试会话调用了 rollback，join_transaction_mode='rollback_only' 下外层事务已被回滚；需要局部回滚时改用 create_savepoint")
+
+# 测试用户统一使用的明文密码
+TEST_PASSWORD = "testpassword"
+
+# 测试用户名/手机号的递增序号，保证同一会话内不重复
+_user_seq = itertools.count(1)
+_phone_seq = itertools.count(13810010000)
+
+@pytest.fixture(scope="session")
+def password_hash() -> str:
+    # 整个测试会话只计算一次密码哈希
+    return get_password_hash(TEST_PASSWORD)
+
+def _new_user(role: UserRole, password_hash: str, is_superuser: bool = False) -> User:
+    # 只构建对象，由调用方决定何时提交
+    username = f"test_{role.value.lower()}_{_WORKER_ID}_{next(_user_seq)}"
+    return User(
+        username=username,
+        email=f"{username}@example.com",
+        phone=str(next(_phone_seq)),
+        full_name=f"测试 {role.name} 用户",
+        hashed_password=password_hash,
+        role=role,
+        is_superuser=is_superuser,
+    )
+
+@functools.lru_cache(maxsize=None)
+def _token_for(user_id: int) -> str:
+    # 测试回滚后自增 ID 会被复用，令牌只含用户 ID，同一 ID 只签发一次
+    return create_access_token(user_id)
+
+def _auth_headers(db_user: User) -> dict:
+    # 请求头直接交给测试复用
+    return {"Authorization": f"Bearer {_token_for(db_user.id)}"}
+
+@pytest.fixture(scope="function")
+def user_factory(db, password_hash):
+    """按角色创建测试用户并返回 (user, 认证请求头)，直接写入预计算的哈希"""
+    def _create(role: UserRole, is_superuser: bool = False) -> tuple[User, dict]:
+        db_user = _new_user(role, password_hash, is_superuser)
+        db.add(db_user)
+        db.commit()
+        return db_user, _auth_headers(db_user)
+    return _create
 
 @pytest.fixture(scope="function")
-def client(db):
+def users_factory(db, password_hash):
+    """一次创建多个角色的测试用户，只提交一次，返回 [(user, 认证请求头), ...]"""
+    def _create(*roles: UserRole) -> list[tuple[User, dict]]:
+        db_users = [_new_user(role, password_hash) for role in roles]
+        db.add_all(db_users)
+        db.commit()
+        return [(db_user, _auth_headers(db_user)) for db_user in db_users]
+    return _create
+
+@pytest.fixture(scope="session")
+def seed_users(password_hash):
+    """module/session 级准备数据用：在调用方的独立会话中真实提交用户，返回 [(user, 认证请求头), ...]"""
+    def _create(seed_db: Session, *roles: UserRole, is_superuser: bool = False) -> list[tuple[User, dict]]:
+        db_users = [_new_user(role, password_hash, is_superuser) for role in roles]
+        seed_db.add_all(db_users)
+        seed_db.commit()
+        return [(db_user, _auth_headers(db_user)) for db_user in db_users]
+    return _create
+
+@pytest.fixture(scope="session")
+def admin_auth(db_engine, seed_users) -> dict:
+    """整个测试会话共用的超级管理员认证请求头，在测试事务之外真实提交一次"""
+    with Session(bind=db_engine, expire_on_commit=False) as seed_db:
+        [(_, headers)] = seed_users(seed_db, UserRole.ADMIN, is_superuser=True)
+    return headers
+
+@pytest.fixture(scope="function")
+def role_user(request, user_factory):
+    """间接参数化使用：request.param 为角色，返回 (user, 认证请求头)"""
+    return user_factory(request.param)
+
+@pytest.fixture(scope="function")
+def raw_insert(db):
+    """准备测试数据用：直接 INSERT 并返回 ORM 对象，跳过 CRUD 层的校验和关系加载"""
+    def _insert(model, *rows, **fields):
+        # 传入多个 dict 时一条语句批量插入并返回列表，否则按关键字参数插入单行
+        objs = db.scalars(insert(model).returning(model, sort_by_parameter_order=True), list(rows) or [fields]).all()
+        db.commit()
+        return objs if rows else objs[0]
+    return _insert
+
+@pytest.fixture(scope="function")
+def query_counter(db_engine):
+    """记录 with 块内实际发出的 SQL 语句，用于发现关系懒加载 (N+1)"""
+    @contextlib.contextmanager
+    def _count():
+        statements = []
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", _record)
+    return _count
+
+def _override_db(db):
     # 使用测试数据库会话替代应用中的数据库会话
     def override_get_db():
+        # 每个请求开始时让已加载的对象过期，模拟应用中每个请求一个新会话
+        db.expire_all()
         try:
             yield db
         finally:
             pass
-    
-    app.dependency_overrides[get_db] = override_get_db
+
+    # 端点分别依赖 app.db.session.get_db 和 app.api.deps.get_db（鉴权依赖链），两个都要覆盖
+    app.dependency_overrides[db_session.get_db] = override_get_db
+    app.dependency_overrides[deps.get_db] = override_get_db
+
+@pytest.fixture(scope="session")
+def app_client():
+    # 整个测试会话只启动一次应用（lifespan/startup 事件只跑一次）
     with TestClient(app) as c:
         yield c
+
+@pytest.fixture(scope="function")
+def client(app_client, db):
+    # 复用会话级 TestClient，每个测试只切换数据库会话
+    _override_db(db)
+    yield app_client
     # 清理依赖覆盖
-    app.dependency_overrides = {}
\ No newline at end of file
+    app.dependency_overrides = {}
+
+# 安装了 uvloop 时异步测试跑在 uvloop 事件循环上，否则使用默认的 asyncio 循环
+try:
+    import uvloop  # noqa: F401
+except ImportError:
+    _ANYIO_BACKEND = "asyncio"
+else:
+    _ANYIO_BACKEND = ("asyncio", {"use_uvloop": True})
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # 异步测试统一跑在 asyncio 上
+    return _ANYIO_BACKEND
+
+@pytest.fixture(scope="function")
+async def async_client(db):
+    # 直接通过 ASGI 调用应用，不经过 TestClient 的线程 portal
+    _override_db(db)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+    app.dependency_overrides = {}
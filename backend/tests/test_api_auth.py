@@ -1,59 +1,66 @@
 import pytest
-from fastapi.testclient import TestClient
+import orjson
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
 
-from main import app
-from app.crud.crud_user import user
-from app.schemas.user import UserCreate
-from app.models.user import UserRole
+from app.models.user import User, UserRole
+
+# 本模块的测试都通过 AsyncClient 异步调用接口
+pytestmark = pytest.mark.anyio
+
+TEST_PASSWORD = "testpassword"
+
+# 辅助函数：直接写入带预计算哈希的用户，跳过 user.create 中的哈希计算
+def create_user_with_hash(db: Session, password_hash: str, **fields) -> User:
+    db_user = User(hashed_password=password_hash, role=UserRole.CUSTOMER, **fields)
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    return db_user
 
 # 测试登录API
-def test_login(client: TestClient, db: Session):
+async def test_login(async_client: AsyncClient, db: Session, password_hash: str):
     # 创建测试用户
-    user_in = UserCreate(
+    create_user_with_hash(
+        db, password_hash,
         username="testlogin",
         email="testlogin@example.com",
         phone="13800001111",
-        password="testpassword",
-        full_name="测试登录用户",
-        role=UserRole.CUSTOMER
+        full_name="测试登录用户"
     )
-    db_user = user.create(db, obj_in=user_in)
     
     # 测试登录
     login_data = {
         "username": "testlogin",
-        "password": "testpassword"
+        "password": TEST_PASSWORD
     }
-    response = client.post("/api/v1/auth/login", data=login_data)
+    response = await async_client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 200
-    token_data = response.json()
+    token_data = orjson.loads(response.content)
     assert "access_token" in token_data
     assert token_data["token_type"] == "bearer"
 
 # 测试登录失败
-def test_login_wrong_password(client: TestClient, db: Session):
+async def test_login_wrong_password(async_client: AsyncClient, db: Session, password_hash: str):
     # 创建测试用户
-    user_in = UserCreate(
+    create_user_with_hash(
+        db, password_hash,
         username="testwrongpw",
         email="testwrongpw@example.com",
         phone="13800002222",
-        password="testpassword",
-        full_name="测试登录失败用户",
-        role=UserRole.CUSTOMER
+        full_name="测试登录失败用户"
     )
-    db_user = user.create(db, obj_in=user_in)
     
     # 测试错误密码登录
     login_data = {
         "username": "testwrongpw",
         "password": "wrongpassword"
     }
-    response = client.post("/api/v1/auth/login", data=login_data)
+    response = await async_client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 401
 
 # 测试注册API
-def test_register(client: TestClient, db: Session):
+async def test_register(async_client: AsyncClient, db: Session):
     # 测试注册新用户
     register_data = {
         "username": "testregister",
@@ -63,24 +70,22 @@ def test_register(client: TestClient, db: Session):
         "full_name": "测试注册用户",
         "role": UserRole.CUSTOMER
     }
-    response = client.post("/api/v1/auth/register", json=register_data)
+    response = await async_client.post("/api/v1/auth/register", json=register_data)
     assert response.status_code == 200
-    token_data = response.json()
+    token_data = orjson.loads(response.content)
     assert "access_token" in token_data
     assert token_data["token_type"] == "bearer"
 
 # 测试重复注册
-def test_register_duplicate(client: TestClient, db: Session):
+async def test_register_duplicate(async_client: AsyncClient, db: Session, password_hash: str):
     # 创建测试用户
-    user_in = UserCreate(
+    create_user_with_hash(
+        db, password_hash,
         username="testduplicate",
         email="testduplicate@example.com",
         phone="13800004444",
-        password="testpassword",
-        full_name="测试重复注册用户",
-        role=UserRole.CUSTOMER
+        full_name="测试重复注册用户"
     )
-    db_user = user.create(db, obj_in=user_in)
     
     # 测试重复注册
     register_data = {
@@ -91,5 +96,5 @@ def test_register_duplicate(client: TestClient, db: Session):
         "full_name": "测试重复注册用户2",
         "role": UserRole.CUSTOMER
     }
-    response = client.post("/api/v1/auth/register", json=register_data)
+    response = await async_client.post("/api/v1/auth/register", json=register_data)
     assert response.status_code == 400
\ No newline at end of file
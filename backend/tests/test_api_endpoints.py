@@ -1,108 +1,184 @@
+import itertools
 import pytest
-import random
-from fastapi.testclient import TestClient
+import uuid
+import orjson
+from types import SimpleNamespace
+from httpx import AsyncClient
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
-from app.crud import user, order, property as crud_property_module, transport, recycling, address, community as crud_community_module
+from app.crud import property_company as crud_property_company, recycling_company, community as crud_community_module
 from app.crud.crud_property_manager import property_manager as crud_prop_manager
-from app.schemas.user import UserCreate
-from app.schemas.order import OrderCreate, OrderStatusUpdate
-from app.schemas.property import PropertyCreate
+from app.schemas.property_company import PropertyCompanyCreate
 from app.schemas.property_manager import PropertyManagerCreate
-from app.schemas.transport import TransportCreate
-from app.schemas.recycling import RecyclingCreate
-from app.schemas.address import AddressCreate
+from app.schemas.recycling_company import RecyclingCompanyCreate
 from app.schemas.community import CommunityCreate
 from app.models.user import User, UserRole
-from app.models.order import OrderStatus
-from app.models.transport import DriverStatus
-from app.models.recycling import RecyclingStatus
-from app.models.property import Property
+from app.models.order import Order, OrderStatus
+from app.models.recycling_company import RecyclingCompanyStatus
+from app.models.property_company import PropertyCompany as Property
 from app.models.community import Community
-from app.core.security import create_access_token
-
-# 辅助函数：创建不同角色的测试用户并返回token
-def create_user_with_role(db: Session, role: UserRole, is_superuser=False) -> tuple[User, str]:
-    random_number = random.randint(10000, 19999)
-    username = f"test_{role.value.lower()}_{random_number}"
-    
-    user_in = UserCreate(
-        username=username,
-        email=f"{username}@example.com",
-        phone=f"138100{random_number}",
-        password="testpassword",
-        full_name=f"测试 {role.name} 用户",
-        role=role,
-        is_superuser=is_superuser
-    )
-    db_user = user.create(db, obj_in=user_in)
-    access_token = create_access_token(db_user.id)
-    return db_user, access_token
+from app.models.address import Address
+from app.models.property_manager import PropertyManager
+
+# 本模块的测试都通过 AsyncClient 异步调用接口
+pytestmark = pytest.mark.anyio
+
+# 接口路径模板，集中维护
+ORDERS = "/api/v1/orders/"
+ORDER_DETAIL = "/api/v1/orders/{id}"
+ORDER_STATUS = "/api/v1/orders/{id}/status"
+PROPERTIES = "/api/v1/property-companies/"
+PROPERTY_DETAIL = "/api/v1/property-companies/{id}"
+PROPERTY_MANAGERS = "/api/v1/property-managers/"
+COMPANY_MANAGERS = "/api/v1/property-managers/company/{id}"
+PROPERTY_MANAGER_DETAIL = "/api/v1/property-managers/{pm_id}"
+COMMUNITY_DETAIL = "/api/v1/communities/{id}"
+RECYCLINGS = "/api/v1/recycling-companies/"
+
+# 用 orjson 解析响应体，与服务端的 ORJSONResponse 对应
+def rjson(response):
+    return orjson.loads(response.content)
+
+# 测试数据名称后缀的递增序号，整个测试进程内不重复
+_UID = itertools.count(1)
+
+# 各资源的创建请求体
+PROPERTY_PAYLOAD = {
+    "name": "测试物业",
+    "address": "测试地址",
+    "contact_name": "测试联系人",
+    "contact_phone": "13800001111"
+}
+RECYCLING_PAYLOAD = {
+    "name": "测试回收站",
+    "address": "测试地址",
+    "contact_name": "测试联系人",
+    "contact_phone": "13800003333",
+    "capacity_tons_per_day": 100.0
+}
+
+# 常量请求体预先编码一次，发送时用 content= 直接传 bytes
+PROPERTY_BODY = orjson.dumps(PROPERTY_PAYLOAD)
+RECYCLING_BODY = orjson.dumps(RECYCLING_PAYLOAD)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 只读的共享 schema 实例，准备数据时直接复用
+PROPERTY_IN = PropertyCompanyCreate(**PROPERTY_PAYLOAD)
+RECYCLING_IN = RecyclingCompanyCreate(**RECYCLING_PAYLOAD)
 
 # 辅助函数：创建测试物业和小区 (因为地址和小区强相关)
 def create_test_property_and_community(db: Session, manager_user: User) -> tuple[Property, Community]:
-    prop_in = PropertyCreate(
-        name=f"测试物业_{random.randint(1000,9999)}", 
-        address=f"测试物业地址_{random.randint(1000,9999)}",
+    uid = next(_UID)
+    prop_in = PropertyCompanyCreate(
+        name=f"测试物业_{uid}",
+        address=f"测试物业地址_{uid}",
         contact_name="物业联系人",
         contact_phone="13700008888"
     )
-    test_prop = crud_property_module.create_with_manager(db, obj_in=prop_in, manager_id=manager_user.id)
+    test_prop = crud_property_company.create_with_primary_manager(db, obj_in=prop_in, manager_user_id=manager_user.id)
     
     community_in = CommunityCreate(
-        name=f"测试小区_{random.randint(1000,9999)}",
-        address=f"测试小区地址_{random.randint(1000,9999)}",
+        name=f"测试小区_{uid}",
+        address=f"测试小区地址_{uid}",
+        property_company_id=test_prop.id,
     )
-    test_community = crud_community_module.create_with_property(db, obj_in=community_in, property_id=test_prop.id)
+    test_community = crud_community_module.create_with_property_company(db, obj_in=community_in)
     return test_prop, test_community
 
-# 辅助函数：创建测试地址 (需要 community_id)
-def create_test_address(db: Session, user_id: int, community_id: int, suffix: str = ""):
-    address_in = AddressCreate(
-        address=f"测试街道_{suffix}",
-        community_id=community_id,
-        building_number=f"B{random.randint(1,10)}{suffix}",
-        room_number=f"R{random.randint(100,199)}{suffix}",
-        contact_name=f"联系人_{suffix}",
-        contact_phone=f"1390000{random.randint(1000,1999)}",
-        is_default=True
+# 辅助函数：测试地址的字段 (需要 community_id)
+def address_row(user_id: int, community_id: int, suffix: str = "") -> dict:
+    uid = next(_UID)
+    return {
+        "user_id": user_id,
+        "address": f"测试街道_{suffix}",
+        "community_id": community_id,
+        "building_number": f"B{uid}{suffix}",
+        "room_number": f"R{uid}{suffix}",
+        "contact_name": f"联系人_{suffix}",
+        "contact_phone": f"139{uid:08d}",
+        "is_default": True,
+    }
+
+# 辅助函数：直接创建测试地址，AddressCreate 的校验由 test_crud 覆盖
+def create_test_address(db: Session, user_id: int, community_id: int, suffix: str = "") -> Address:
+    db_address = Address(**address_row(user_id, community_id, suffix))
+    db.add(db_address)
+    db.commit()
+    return db_address
+
+# 辅助函数：直接插入待处理订单，只用于准备数据
+def order_row(customer_id: int, address_id: int, waste_type: str, waste_volume: float = 1, **fields) -> dict:
+    # fields 用于直接写入状态等其他列
+    return {
+        "order_number": f"ORD-TEST-{uuid.uuid4().hex[:8].upper()}",
+        "customer_id": customer_id,
+        "address_id": address_id,
+        "waste_type": waste_type,
+        "waste_volume": waste_volume,
+        **fields,
+    }
+
+def insert_order(raw_insert, customer_id: int, address_id: int, waste_type: str, waste_volume: float = 1) -> Order:
+    return raw_insert(Order, **order_row(customer_id, address_id, waste_type, waste_volume))
+
+@pytest.fixture(scope="module")
+def seed_baseline(db_engine, seed_users) -> SimpleNamespace:
+    """本模块共享的只读骨架：一个物业 (含主管理员)、其下 A、B 两个小区、一名客户及其在 A 小区的地址
+
+    在测试事务之外真实提交一次，测试中对它的修改随各自的事务回滚；模块结束时删除
+    """
+    with Session(bind=db_engine, expire_on_commit=False) as seed_db:
+        (manager, manager_headers), (customer, customer_headers) = seed_users(seed_db, UserRole.PROPERTY, UserRole.CUSTOMER)
+        prop, community_A = create_test_property_and_community(seed_db, manager_user=manager)
+        community_B = crud_community_module.create_with_property_company(
+            seed_db, obj_in=CommunityCreate(name=f"Comm B_{next(_UID)}", address="Addr B", property_company_id=prop.id)
+        )
+        address_A = create_test_address(seed_db, customer.id, community_A.id, suffix="_baseline")
+
+    yield SimpleNamespace(
+        property=prop, community_A=community_A, community_B=community_B,
+        manager=manager, manager_headers=manager_headers,
+        customer=customer, customer_headers=customer_headers,
+        address_A=address_A,
     )
-    return address.create_with_user(db, obj_in=address_in, user_id=user_id)
+
+    # 按外键依赖的逆序删除，后续模块看不到这些数据
+    with Session(bind=db_engine) as seed_db:
+        seed_db.execute(delete(Address).where(Address.id == address_A.id))
+        seed_db.execute(delete(PropertyManager).where(PropertyManager.property_company_id == prop.id))
+        seed_db.execute(delete(Community).where(Community.id.in_((community_A.id, community_B.id))))
+        seed_db.execute(delete(Property).where(Property.id == prop.id))
+        seed_db.execute(delete(User).where(User.id.in_((manager.id, customer.id))))
+        seed_db.commit()
 
 # ============ 订单API测试 ============
 
 # 测试创建订单
-def test_create_order(client: TestClient, db: Session):
-    # 创建物业用户 (用于创建物业和小区)
-    prop_manager_user, _ = create_user_with_role(db, UserRole.PROPERTY)
-    _, test_community = create_test_property_and_community(db, manager_user=prop_manager_user)
+async def test_create_order(async_client: AsyncClient, seed_baseline):
+    # 基线客户在 A 小区的地址下单
+    b = seed_baseline
+    test_community, test_address, headers = b.community_A, b.address_A, b.customer_headers
 
-    # 创建客户用户
-    customer_user, token = create_user_with_role(db, UserRole.CUSTOMER)
-    
-    # 创建测试地址 (关联到小区)
-    test_address = create_test_address(db, customer_user.id, test_community.id, suffix="_create_order")
-    
     order_data_in = {
         "address_id": test_address.id,
         "waste_type": "建筑垃圾 From Create Order Test",
         "waste_volume": 2.5
     }
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.post("/api/v1/orders/", json=order_data_in, headers=headers)
+    response = await async_client.post(ORDERS, json=order_data_in, headers=headers)
     assert response.status_code == 201, response.text
-    order_data_out = response.json()
+    order_data_out = rjson(response)
     assert order_data_out["address"]["community_id"] == test_community.id
     assert order_data_out["address"]["community"]["name"] == test_community.name
     assert order_data_out["status"] == OrderStatus.PENDING.value
 
 # 测试非客户用户创建订单（应该被禁止）
-def test_create_order_forbidden(client: TestClient, db: Session):
-    prop_user_for_addr, _ = create_user_with_role(db, UserRole.PROPERTY)
+async def test_create_order_forbidden(async_client: AsyncClient, db: Session, user_factory):
+    prop_user_for_addr, _ = user_factory(UserRole.PROPERTY)
     _, community_for_addr = create_test_property_and_community(db, prop_user_for_addr)
 
     # 创建物业用户 (试图创建订单的用户)
-    property_user_trying, token = create_user_with_role(db, UserRole.PROPERTY)
+    property_user_trying, headers = user_factory(UserRole.PROPERTY)
     
     # 创建测试地址 (可以属于 property_user_trying 或其他用户，但订单创建者是关键)
     test_address_forbidden = create_test_address(db, property_user_trying.id, community_for_addr.id, suffix="_forbidden")
@@ -112,289 +188,189 @@ def test_create_order_forbidden(client: TestClient, db: Session):
         "waste_type": "建筑垃圾",
         "waste_volume": 2.5
     }
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.post("/api/v1/orders/", json=order_data, headers=headers)
+    response = await async_client.post(ORDERS, json=order_data, headers=headers)
     assert response.status_code == 403, response.text
 
+@pytest.fixture
+def customer_orders(seed_baseline, raw_insert) -> SimpleNamespace:
+    """基线客户在 A 小区的两个订单：一个待处理，一个已由基线物业管理员确认"""
+    b = seed_baseline
+    test_address = b.address_A
+    # 确认状态直接写入，确认接口本身由 test_update_order_status 覆盖
+    pending, confirmed = raw_insert(
+        Order,
+        order_row(b.customer.id, test_address.id, "T1 PENDING"),
+        order_row(b.customer.id, test_address.id, "T2 CONFIRMED", waste_volume=2,
+                  status=OrderStatus.PROPERTY_CONFIRMED.value, property_manager_id=b.manager.id),
+    )
+    return SimpleNamespace(
+        customer_headers=b.customer_headers, community=b.community_A, pending=pending, confirmed=confirmed,
+    )
+
 # 测试获取订单列表 (客户视角)
-def test_read_orders_as_customer(client: TestClient, db: Session):
-    # 1. 设置基础环境: 物业、小区
-    prop_mgr_user_owner, prop_mgr_owner_token = create_user_with_role(db, UserRole.PROPERTY) # This user will own the property
-    test_property, test_community = create_test_property_and_community(db, manager_user=prop_mgr_user_owner)
-    
-    # 2. 创建客户和客户的地址
-    customer_user, customer_token = create_user_with_role(db, UserRole.CUSTOMER)
-    test_address = create_test_address(db, user_id=customer_user.id, community_id=test_community.id, suffix="_read_cust")
-    
-    # 3. 客户创建两个订单 (初始都为 PENDING)
-    order1_pending = order.create_with_customer(db, obj_in=OrderCreate(address_id=test_address.id, waste_type="T1 PENDING", waste_volume=1), customer_id=customer_user.id)
-    order2_to_be_confirmed = order.create_with_customer(db, obj_in=OrderCreate(address_id=test_address.id, waste_type="T2 TO_BE_CONFIRMED", waste_volume=2), customer_id=customer_user.id)
-
-    # 4. 物业管理员确认其中一个订单
-    # prop_mgr_user_owner is the primary manager of test_property, so they can confirm orders in test_community.
-    confirm_payload = {"status": OrderStatus.PROPERTY_CONFIRMED.value}
-    confirm_headers = {"Authorization": f"Bearer {prop_mgr_owner_token}"}
-    response_confirm = client.put(f"/api/v1/orders/{order2_to_be_confirmed.id}/status", json=confirm_payload, headers=confirm_headers)
-    assert response_confirm.status_code == 200, f"Failed to confirm order: {response_confirm.text}"
-    confirmed_order_data = response_confirm.json()
-    assert confirmed_order_data["status"] == OrderStatus.PROPERTY_CONFIRMED.value
-    assert confirmed_order_data["property_manager_id"] == prop_mgr_user_owner.id
-
-    # 5. 客户获取自己的订单列表
-    cust_headers = {"Authorization": f"Bearer {customer_token}"}
-    response_all = client.get("/api/v1/orders/", headers=cust_headers)
-    assert response_all.status_code == 200, response_all.text
-    orders_data = response_all.json()
+async def test_read_orders_as_customer(async_client: AsyncClient, customer_orders):
+    s = customer_orders
+    response = await async_client.get(ORDERS, headers=s.customer_headers)
+    assert response.status_code == 200, response.text
+    orders_data = rjson(response)
     assert isinstance(orders_data, list)
-    assert len(orders_data) == 2 # Should get both orders
-    
-    # Verify one order is PENDING and the other is PROPERTY_CONFIRMED by checking their IDs and statuses
-    found_pending = False
-    found_confirmed = False
-    for o_data in orders_data:
-        if o_data["id"] == order1_pending.id:
-            assert o_data["status"] == OrderStatus.PENDING.value
-            found_pending = True
-        elif o_data["id"] == order2_to_be_confirmed.id:
-            assert o_data["status"] == OrderStatus.PROPERTY_CONFIRMED.value
-            found_confirmed = True
-        assert o_data["address"]["community_id"] == test_community.id # Check community info consistency
-    assert found_pending and found_confirmed, "Did not find both pending and confirmed orders for customer"
-
-    # 6. 测试状态过滤 (客户视角)
-    response_pending_filter = client.get("/api/v1/orders/?status=pending", headers=cust_headers)
-    assert response_pending_filter.status_code == 200, response_pending_filter.text
-    pending_orders_data = response_pending_filter.json()
-    assert len(pending_orders_data) == 1
-    assert pending_orders_data[0]["id"] == order1_pending.id
-    assert pending_orders_data[0]["status"] == OrderStatus.PENDING.value
-
-    response_confirmed_filter = client.get("/api/v1/orders/?status=property_confirmed", headers=cust_headers)
-    assert response_confirmed_filter.status_code == 200, response_confirmed_filter.text
-    confirmed_orders_data = response_confirmed_filter.json()
-    assert len(confirmed_orders_data) == 1
-    assert confirmed_orders_data[0]["id"] == order2_to_be_confirmed.id
-    assert confirmed_orders_data[0]["status"] == OrderStatus.PROPERTY_CONFIRMED.value
-
-def test_read_orders_as_property_manager(client: TestClient, db: Session):
-    # Setup: Property, CommunityA, CommunityB
-    primary_mgr_user, primary_token = create_user_with_role(db, UserRole.PROPERTY, is_superuser=False)
-    test_prop, community_A = create_test_property_and_community(db, manager_user=primary_mgr_user)
-    community_B = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name=f"Comm B_{random.randint(100,199)}", address="Addr B"), property_id=test_prop.id)
-
-    # Normal manager for Community A
-    normal_mgr_A_user, normal_mgr_A_token = create_user_with_role(db, UserRole.PROPERTY)
-    crud_prop_manager.create(db, obj_in=PropertyManagerCreate(manager_id=normal_mgr_A_user.id, role="Normal A", is_primary=False, community_id=community_A.id), property_id=test_prop.id)
-
-    # Customer and orders
-    customer, _ = create_user_with_role(db, UserRole.CUSTOMER)
-    addr_A1 = create_test_address(db, customer.id, community_A.id, "_RA1")
-    ord_A1 = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_A1.id, waste_type="CA1", waste_volume=1), customer_id=customer.id)
-    addr_A2 = create_test_address(db, customer.id, community_A.id, "_RA2")
-    ord_A2 = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_A2.id, waste_type="CA2", waste_volume=1), customer_id=customer.id)
-    addr_B1 = create_test_address(db, customer.id, community_B.id, "_RB1")
-    ord_B1 = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_B1.id, waste_type="CB1", waste_volume=1), customer_id=customer.id)
+    # 两个订单都能看到，且状态和小区信息正确
+    assert {o["id"]: o["status"] for o in orders_data} == {
+        s.pending.id: OrderStatus.PENDING.value,
+        s.confirmed.id: OrderStatus.PROPERTY_CONFIRMED.value,
+    }
+    assert all(o["address"]["community_id"] == s.community.id for o in orders_data)
+
+# 测试按状态过滤订单列表 (客户视角)
+@pytest.mark.parametrize("status,expected", [
+    (OrderStatus.PENDING, "pending"),
+    (OrderStatus.PROPERTY_CONFIRMED, "confirmed"),
+])
+async def test_read_orders_as_customer_status_filter(async_client: AsyncClient, customer_orders, status, expected):
+    s = customer_orders
+    response = await async_client.get(ORDERS, params={"status": status.value}, headers=s.customer_headers)
+    assert response.status_code == 200, response.text
+    orders_data = rjson(response)
+    assert len(orders_data) == 1
+    assert {"id": getattr(s, expected).id, "status": status.value}.items() <= orders_data[0].items()
+
+@pytest.fixture
+def community_orders(db: Session, seed_baseline, user_factory, raw_insert) -> SimpleNamespace:
+    """基线物业的 A、B 两个小区：A 小区再加一名普通管理员，客户在 A、B 各有一个待处理订单"""
+    b = seed_baseline
+    test_prop, community_A, community_B = b.property, b.community_A, b.community_B
+    primary_user, primary_headers = b.manager, b.manager_headers
+    customer, customer_headers = b.customer, b.customer_headers
+    normal_A_user, normal_A_headers = user_factory(UserRole.PROPERTY)
+
+    crud_prop_manager.create(db, obj_in=PropertyManagerCreate(
+        manager_id=normal_A_user.id, role="Normal A", is_primary=False, community_id=community_A.id, property_company_id=test_prop.id
+    ))
+
+    # A 小区沿用基线地址，B 小区的地址和两个订单直接插入
+    addr_A = b.address_A
+    addr_B = raw_insert(Address, **address_row(customer.id, community_B.id, "_B"))
+    ord_A, ord_B = raw_insert(
+        Order,
+        order_row(customer.id, addr_A.id, "PendingA"),
+        order_row(customer.id, addr_B.id, "PendingB"),
+    )
+
+    return SimpleNamespace(
+        community_A=community_A, community_B=community_B,
+        primary_user=primary_user, primary_headers=primary_headers,
+        normal_A_user=normal_A_user, normal_A_headers=normal_A_headers,
+        customer=customer, customer_headers=customer_headers,
+        addr_A=addr_A, addr_B=addr_B, ord_A=ord_A, ord_B=ord_B,
+    )
+
+async def test_read_orders_as_property_manager(async_client: AsyncClient, db: Session, user_factory, community_orders, raw_insert):
+    s = community_orders
+    # A 小区再加一个订单
+    ord_A2 = insert_order(raw_insert, s.customer.id, s.addr_A.id, "CA2")
 
     # Primary manager should see all 3 orders
-    headers_primary = {"Authorization": f"Bearer {primary_token}"}
-    response_primary = client.get("/api/v1/orders/", headers=headers_primary)
+    response_primary = await async_client.get(ORDERS, headers=s.primary_headers)
     assert response_primary.status_code == 200, response_primary.text
-    primary_orders = {o["id"] for o in response_primary.json()}
-    assert primary_orders == {ord_A1.id, ord_A2.id, ord_B1.id}
+    primary_orders = {o["id"] for o in rjson(response_primary)}
+    assert primary_orders == {s.ord_A.id, ord_A2.id, s.ord_B.id}
 
     # Normal manager A should see 2 orders from Community A
-    headers_normal_A = {"Authorization": f"Bearer {normal_mgr_A_token}"}
-    response_normal_A = client.get("/api/v1/orders/", headers=headers_normal_A)
+    response_normal_A = await async_client.get(ORDERS, headers=s.normal_A_headers)
     assert response_normal_A.status_code == 200, response_normal_A.text
-    normal_A_orders = {o["id"] for o in response_normal_A.json()}
-    assert normal_A_orders == {ord_A1.id, ord_A2.id}
+    normal_A_orders = {o["id"] for o in rjson(response_normal_A)}
+    assert normal_A_orders == {s.ord_A.id, ord_A2.id}
 
     # Create a manager for another property, should see 0 of these orders
-    other_prop_mgr_user, other_token = create_user_with_role(db, UserRole.PROPERTY)
+    other_prop_mgr_user, other_headers = user_factory(UserRole.PROPERTY)
     create_test_property_and_community(db, manager_user=other_prop_mgr_user) # Creates unrelated property & community
-    headers_other = {"Authorization": f"Bearer {other_token}"}
-    response_other = client.get("/api/v1/orders/", headers=headers_other)
+    response_other = await async_client.get(ORDERS, headers=other_headers)
     assert response_other.status_code == 200, response_other.text
-    assert len(response_other.json()) == 0
+    assert len(rjson(response_other)) == 0
 
 # 测试获取特定订单
-def test_read_order(client: TestClient, db: Session):
-    primary_mgr_user, primary_token = create_user_with_role(db, UserRole.PROPERTY)
-    test_prop, community_A = create_test_property_and_community(db, manager_user=primary_mgr_user)
-    community_B = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name=f"Comm B_{random.randint(200,299)}", address="Addr B Read"), property_id=test_prop.id)
-
-    normal_mgr_A_user, normal_mgr_A_token = create_user_with_role(db, UserRole.PROPERTY)
-    crud_prop_manager.create(db, obj_in=PropertyManagerCreate(manager_id=normal_mgr_A_user.id, role="Normal A Read", is_primary=False, community_id=community_A.id), property_id=test_prop.id)
-
-    customer_user, customer_token = create_user_with_role(db, UserRole.CUSTOMER)
-    addr_A = create_test_address(db, customer_user.id, community_A.id, "_ReadOrdA")
-    ord_A = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_A.id, waste_type="ReadA", waste_volume=1), customer_id=customer_user.id)
-    addr_B = create_test_address(db, customer_user.id, community_B.id, "_ReadOrdB")
-    ord_B = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_B.id, waste_type="ReadB", waste_volume=1), customer_id=customer_user.id)
+async def test_read_order(async_client: AsyncClient, community_orders):
+    s = community_orders
 
     # Customer can read their own order
-    response_cust = client.get(f"/api/v1/orders/{ord_A.id}", headers={"Authorization": f"Bearer {customer_token}"})
+    response_cust = await async_client.get(ORDER_DETAIL.format(id=s.ord_A.id), headers=s.customer_headers)
     assert response_cust.status_code == 200, response_cust.text
-    assert response_cust.json()["id"] == ord_A.id
+    assert rjson(response_cust)["id"] == s.ord_A.id
 
     # Primary manager can read order in Community A and B
-    response_primary_A = client.get(f"/api/v1/orders/{ord_A.id}", headers={"Authorization": f"Bearer {primary_token}"})
+    response_primary_A = await async_client.get(ORDER_DETAIL.format(id=s.ord_A.id), headers=s.primary_headers)
     assert response_primary_A.status_code == 200, response_primary_A.text
-    response_primary_B = client.get(f"/api/v1/orders/{ord_B.id}", headers={"Authorization": f"Bearer {primary_token}"})
+    response_primary_B = await async_client.get(ORDER_DETAIL.format(id=s.ord_B.id), headers=s.primary_headers)
     assert response_primary_B.status_code == 200, response_primary_B.text
 
     # Normal manager A can read order in Community A
-    response_normal_A_CanRead = client.get(f"/api/v1/orders/{ord_A.id}", headers={"Authorization": f"Bearer {normal_mgr_A_token}"})
+    response_normal_A_CanRead = await async_client.get(ORDER_DETAIL.format(id=s.ord_A.id), headers=s.normal_A_headers)
     assert response_normal_A_CanRead.status_code == 200, response_normal_A_CanRead.text
 
     # Normal manager A CANNOT read order in Community B
-    response_normal_A_CannotRead = client.get(f"/api/v1/orders/{ord_B.id}", headers={"Authorization": f"Bearer {normal_mgr_A_token}"})
+    response_normal_A_CannotRead = await async_client.get(ORDER_DETAIL.format(id=s.ord_B.id), headers=s.normal_A_headers)
     assert response_normal_A_CannotRead.status_code == 403, response_normal_A_CannotRead.text
 
 # 测试更新订单状态
-def test_update_order_status(client: TestClient, db: Session):
-    primary_mgr_user, primary_token = create_user_with_role(db, UserRole.PROPERTY)
-    test_prop, community_A = create_test_property_and_community(db, manager_user=primary_mgr_user)
-    community_B = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name=f"Comm B_{random.randint(300,399)}", address="Addr B Update"), property_id=test_prop.id)
-
-    normal_mgr_A_user, normal_mgr_A_token = create_user_with_role(db, UserRole.PROPERTY)
-    crud_prop_manager.create(db, obj_in=PropertyManagerCreate(manager_id=normal_mgr_A_user.id, role="Normal A Update", is_primary=False, community_id=community_A.id), property_id=test_prop.id)
-
-    customer_user, _ = create_user_with_role(db, UserRole.CUSTOMER)
-    addr_A = create_test_address(db, customer_user.id, community_A.id, "_UpdOrdA")
-    ord_A_pending = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_A.id, waste_type="PendingA", waste_volume=1), customer_id=customer_user.id)
-    
-    addr_B = create_test_address(db, customer_user.id, community_B.id, "_UpdOrdB")
-    ord_B_pending = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_B.id, waste_type="PendingB", waste_volume=1), customer_id=customer_user.id)
-
+async def test_update_order_status(async_client: AsyncClient, db: Session, community_orders, raw_insert):
+    s = community_orders
     status_update_payload = {"status": OrderStatus.PROPERTY_CONFIRMED.value}
 
     # Primary manager confirms order in Community A
-    response_primary_confirms_A = client.put(f"/api/v1/orders/{ord_A_pending.id}/status", json=status_update_payload, headers={"Authorization": f"Bearer {primary_token}"})
+    response_primary_confirms_A = await async_client.put(ORDER_STATUS.format(id=s.ord_A.id), json=status_update_payload, headers=s.primary_headers)
     assert response_primary_confirms_A.status_code == 200, response_primary_confirms_A.text
-    data_primary_A = response_primary_confirms_A.json()
-    assert data_primary_A["status"] == OrderStatus.PROPERTY_CONFIRMED.value
-    assert data_primary_A["property_manager_id"] == primary_mgr_user.id
+    data_primary_A = rjson(response_primary_confirms_A)
+    assert {
+        "status": OrderStatus.PROPERTY_CONFIRMED.value,
+        "property_manager_id": s.primary_user.id,
+    }.items() <= data_primary_A.items()
     assert data_primary_A["property_confirm_time"] is not None
-    assert data_primary_A["address"]["community_id"] == community_A.id
+    assert data_primary_A["address"]["community_id"] == s.community_A.id
 
-    # Normal manager A confirms order in Community A (ord_A_pending was already confirmed, let's use a new one or reset)
-    # Recreate a pending order in A for normal_mgr_A to confirm
-    ord_A_pending_for_normal = order.create_with_customer(db, obj_in=OrderCreate(address_id=addr_A.id, waste_type="PendingA Normal", waste_volume=1), customer_id=customer_user.id)
-    response_normal_A_confirms_A = client.put(f"/api/v1/orders/{ord_A_pending_for_normal.id}/status", json=status_update_payload, headers={"Authorization": f"Bearer {normal_mgr_A_token}"})
+    # ord_A 已被确认，为普通管理员 A 新建一个 A 小区的待处理订单
+    ord_A_pending_for_normal = insert_order(raw_insert, s.customer.id, s.addr_A.id, "PendingA Normal")
+    response_normal_A_confirms_A = await async_client.put(ORDER_STATUS.format(id=ord_A_pending_for_normal.id), json=status_update_payload, headers=s.normal_A_headers)
     assert response_normal_A_confirms_A.status_code == 200, response_normal_A_confirms_A.text
-    data_normal_A = response_normal_A_confirms_A.json()
-    assert data_normal_A["status"] == OrderStatus.PROPERTY_CONFIRMED.value
-    assert data_normal_A["property_manager_id"] == normal_mgr_A_user.id
+    data_normal_A = rjson(response_normal_A_confirms_A)
+    assert {
+        "status": OrderStatus.PROPERTY_CONFIRMED.value,
+        "property_manager_id": s.normal_A_user.id,
+    }.items() <= data_normal_A.items()
 
     # Normal manager A CANNOT confirm order in Community B
-    response_normal_A_confirms_B = client.put(f"/api/v1/orders/{ord_B_pending.id}/status", json=status_update_payload, headers={"Authorization": f"Bearer {normal_mgr_A_token}"})
+    response_normal_A_confirms_B = await async_client.put(ORDER_STATUS.format(id=s.ord_B.id), json=status_update_payload, headers=s.normal_A_headers)
     assert response_normal_A_confirms_B.status_code == 403, response_normal_A_confirms_B.text # Expecting 403 due to community permission
 
 # ============ 物业API测试 ============
 
-# 测试创建物业信息
-def test_create_property(client: TestClient, db: Session):
-    # 创建物业用户
-    property_user, token = create_user_with_role(db, UserRole.PROPERTY)
-    
-    # 测试创建物业信息
-    property_data = {
-        "name": "测试物业",
-        "address": "测试地址",
-        "contact_name": "测试联系人",
-        "contact_phone": "13800001111"
-    }
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.post("/api/v1/properties/", json=property_data, headers=headers)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["name"] == property_data["name"]
-    assert data["address"] == property_data["address"]
-    assert data["contact_name"] == property_data["contact_name"]
-    assert data["contact_phone"] == property_data["contact_phone"]
-    assert len(data["property_managers"]) == 1
-    assert data["property_managers"][0]["manager_id"] == property_user.id
-    assert data["property_managers"][0]["is_primary"] == True
-
-# 测试获取物业列表
-def test_read_properties(client: TestClient, db: Session):
-    # 创建物业用户和物业信息
-    property_user, token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800001111"
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=property_user.id)
-    
-    # 创建社区
-    community_in = CommunityCreate(
-        name="测试小区",
-        address="测试小区地址"
+@pytest.fixture
+def property_with_community(db: Session, user_factory) -> SimpleNamespace:
+    """物业用户创建的物业及其下一个小区"""
+    property_user, headers = user_factory(UserRole.PROPERTY)
+    db_property = crud_property_company.create_with_primary_manager(db, obj_in=PROPERTY_IN, manager_user_id=property_user.id)
+    db_community = crud_community_module.create_with_property_company(
+        db, obj_in=CommunityCreate(name="测试小区", address="测试小区地址", property_company_id=db_property.id)
     )
-    crud_community_module.create_with_property(db, obj_in=community_in, property_id=db_property.id)
-    
-    # 测试获取物业列表
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/api/v1/properties/", headers=headers)
-    assert response.status_code == 200
-    properties_data = response.json()
-    assert isinstance(properties_data, list)
-    assert len(properties_data) > 0
-    assert properties_data[0]["name"] == "测试物业"
-    assert len(properties_data[0]["property_managers"]) == 1
-    assert properties_data[0]["property_managers"][0]["manager_id"] == property_user.id
+    return SimpleNamespace(user=property_user, headers=headers, property=db_property, community=db_community)
 
 # 测试获取特定物业信息
-def test_read_property(client: TestClient, db: Session):
-    # 创建物业用户和物业信息
-    property_user, token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800001111"
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=property_user.id)
-    
-    # 创建社区
-    community_in = CommunityCreate(
-        name="测试小区",
-        address="测试小区地址"
-    )
-    crud_community_module.create_with_property(db, obj_in=community_in, property_id=db_property.id)
-    
+async def test_read_property(async_client: AsyncClient, property_with_community):
+    s = property_with_community
+    property_user, headers, db_property = s.user, s.headers, s.property
+
     # 测试获取特定物业信息
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get(f"/api/v1/properties/{db_property.id}", headers=headers)
+    response = await async_client.get(PROPERTY_DETAIL.format(id=db_property.id), headers=headers)
     assert response.status_code == 200
-    property_data = response.json()
-    assert property_data["id"] == db_property.id
-    assert property_data["name"] == "测试物业"
+    property_data = rjson(response)
+    assert {"id": db_property.id, "name": "测试物业"}.items() <= property_data.items()
     assert len(property_data["property_managers"]) == 1
     assert property_data["property_managers"][0]["manager_id"] == property_user.id
 
 # 测试更新物业信息
-def test_update_property(client: TestClient, db: Session):
-    # 创建物业用户和物业信息
-    property_user, token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800001111"
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=property_user.id)
-    
-    # 创建社区
-    community_in = CommunityCreate(
-        name="测试小区",
-        address="测试小区地址"
-    )
-    crud_community_module.create_with_property(db, obj_in=community_in, property_id=db_property.id)
-    
+async def test_update_property(async_client: AsyncClient, property_with_community):
+    s = property_with_community
+    property_user, headers, db_property = s.user, s.headers, s.property
+
     # 测试更新物业信息
     update_data = {
         "name": "更新后的物业",
@@ -402,137 +378,94 @@ def test_update_property(client: TestClient, db: Session):
         "contact_name": "更新后的联系人",
         "contact_phone": "13800002222"
     }
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.put(
-        f"/api/v1/properties/{db_property.id}",
+    response = await async_client.put(
+        PROPERTY_DETAIL.format(id=db_property.id),
         json=update_data,
         headers=headers
     )
     assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == update_data["name"]
-    assert data["address"] == update_data["address"]
-    assert data["contact_name"] == update_data["contact_name"]
-    assert data["contact_phone"] == update_data["contact_phone"]
+    data = rjson(response)
+    assert update_data.items() <= data.items()
     assert len(data["property_managers"]) == 1
     assert data["property_managers"][0]["manager_id"] == property_user.id
 
 # 测试删除物业信息
-def test_delete_property(client: TestClient, db: Session):
-    # 创建物业用户和物业信息
-    property_user, token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800001111"
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=property_user.id)
-    
-    # 创建社区
-    community_in = CommunityCreate(
-        name="测试小区",
-        address="测试小区地址"
-    )
-    db_community = crud_community_module.create_with_property(db, obj_in=community_in, property_id=db_property.id)
-    
-    # 创建管理员用户
-    manager, manager_token = create_user_with_role(db, UserRole.ADMIN, is_superuser=True)
-    headers = {"Authorization": f"Bearer {token}"}
+async def test_delete_property(async_client: AsyncClient, admin_auth, property_with_community):
+    s = property_with_community
+    headers, db_property, db_community = s.headers, s.property, s.community
+
     # 验证物业管理员存在
-    response = client.get(f"/api/v1/properties/{db_property.id}/managers", headers=headers)
+    response = await async_client.get(COMPANY_MANAGERS.format(id=db_property.id), headers=headers)
     assert response.status_code == 200
 
     # 测试删除物业信息
-    response = client.delete(f"/api/v1/properties/{db_property.id}", headers={"Authorization": f"Bearer {manager_token}"})
-    assert response.status_code == 200
+    response = await async_client.delete(PROPERTY_DETAIL.format(id=db_property.id), headers=admin_auth)
+    assert response.status_code == 204
     
     # 验证物业已被删除
-    response = client.get(f"/api/v1/properties/{db_property.id}", headers=headers)
+    response = await async_client.get(PROPERTY_DETAIL.format(id=db_property.id), headers=headers)
     assert response.status_code == 404
 
     # 验证物业管理员已被删除
-    response = client.get(f"/api/v1/properties/{db_property.id}/managers", headers=headers)
+    response = await async_client.get(COMPANY_MANAGERS.format(id=db_property.id), headers=headers)
     assert response.status_code == 404
 
     # 验证社区已被删除
-    response = client.get(f"/api/v1/communities/{db_community.id}", headers=headers)
+    response = await async_client.get(COMMUNITY_DETAIL.format(id=db_community.id), headers=headers)
     assert response.status_code == 404
 
-# 测试添加物业管理员
-def test_add_property_manager(client: TestClient, db: Session):
-    # 创建主要管理员和物业
-    primary_manager_user, primary_token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业_add_pm",
-        address="测试地址_add_pm",
-        contact_name="测试联系人",
-        contact_phone="13800001112"
+@pytest.fixture
+def pm_scaffold(db: Session, users_factory) -> SimpleNamespace:
+    """物业管理员测试的公共准备：主要管理员及其物业、一个小区、一名待添加的普通管理员"""
+    (primary_user, primary_headers), (ordinary_user, _) = users_factory(UserRole.PROPERTY, UserRole.PROPERTY)
+    db_property, db_community = create_test_property_and_community(db, manager_user=primary_user)
+    return SimpleNamespace(
+        primary_user=primary_user, primary_headers=primary_headers,
+        property=db_property, community=db_community, ordinary_user=ordinary_user,
     )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=primary_manager_user.id)
-    
-    # 创建一个小区用于关联
-    community_in = CommunityCreate(name="测试小区_add_pm", address="测试小区地址_add_pm")
-    db_community = crud_community_module.create_with_property(db, obj_in=community_in, property_id=db_property.id)
 
-    # 创建新的普通管理员用户
-    new_ordinary_manager_user, _ = create_user_with_role(db, UserRole.PROPERTY, is_superuser=False)
-    
-    # 测试添加普通管理员，关联小区
+async def add_manager(async_client: AsyncClient, s: SimpleNamespace, role: str, community_id: int):
+    # 主要管理员把普通管理员加到指定小区
     manager_data = {
-        "manager_id": new_ordinary_manager_user.id,
-        "role": "普通管理员",
+        "manager_id": s.ordinary_user.id,
+        "role": role,
         "is_primary": False,
-        "community_id": db_community.id
+        "community_id": community_id
     }
-    headers = {"Authorization": f"Bearer {primary_token}"}
-    response = client.post(
-        f"/api/v1/properties/{db_property.id}/managers",
-        json=manager_data,
-        headers=headers
+    return await async_client.post(
+        PROPERTY_MANAGERS,
+        json={"property_company_id": s.property.id, **manager_data},
+        headers=s.primary_headers
     )
-    assert response.status_code == 200, response.json()
-    data = response.json()
-    assert data["manager_id"] == new_ordinary_manager_user.id
-    assert data["role"] == "普通管理员"
-    assert not data["is_primary"]
-    assert data["community_id"] == db_community.id
-    assert data["community"] is not None
-    assert data["community"]["id"] == db_community.id
 
-# 测试更新物业管理员
-def test_update_property_manager(client: TestClient, db: Session):
-    # 创建主要管理员和物业
-    primary_manager_user, primary_token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业_upd_pm",
-        address="测试地址_upd_pm",
-        contact_name="测试联系人",
-        contact_phone="13800001113",
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=primary_manager_user.id)
-    
-    # 创建一个小区用于关联
-    db_community1 = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name="小区1_upd_pm", address="地址1"), property_id=db_property.id)
-    db_community2 = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name="小区2_upd_pm", address="地址2"), property_id=db_property.id)
+# 测试添加物业管理员
+async def test_add_property_manager(async_client: AsyncClient, pm_scaffold):
+    s = pm_scaffold
 
-    # 创建新的普通管理员用户并添加
-    new_ordinary_manager_user, _ = create_user_with_role(db, UserRole.PROPERTY)
-    
-    add_manager_data = {
-        "manager_id": new_ordinary_manager_user.id,
+    # 测试添加普通管理员，关联小区
+    response = await add_manager(async_client, s, "普通管理员", s.community.id)
+    assert response.status_code == 201, rjson(response)
+    data = rjson(response)
+    assert {
+        "manager_id": s.ordinary_user.id,
         "role": "普通管理员",
         "is_primary": False,
-        "community_id": db_community1.id
-    }
-    headers = {"Authorization": f"Bearer {primary_token}"}
-    add_response = client.post(
-        f"/api/v1/properties/{db_property.id}/managers",
-        json=add_manager_data,
-        headers=headers
+        "community_id": s.community.id,
+    }.items() <= data.items()
+    assert data["community"] is not None
+    assert data["community"]["id"] == s.community.id
+
+# 测试更新物业管理员
+async def test_update_property_manager(async_client: AsyncClient, db: Session, pm_scaffold):
+    s = pm_scaffold
+    # 再建一个小区，用于更改关联
+    db_community2 = crud_community_module.create_with_property_company(
+        db, obj_in=CommunityCreate(name="小区2_upd_pm", address="地址2", property_company_id=s.property.id)
     )
-    assert add_response.status_code == 200, add_response.json()
-    pm_id_to_update = add_response.json()["id"]
+
+    add_response = await add_manager(async_client, s, "普通管理员", s.community.id)
+    assert add_response.status_code == 201, rjson(add_response)
+    pm_id_to_update = rjson(add_response)["id"]
     
     # 测试更新管理员信息，更改角色和关联小区
     update_data = {
@@ -540,190 +473,75 @@ def test_update_property_manager(client: TestClient, db: Session):
         "is_primary": False,
         "community_id": db_community2.id
     }
-    update_response = client.put(
-        f"/api/v1/properties/{db_property.id}/managers/{pm_id_to_update}",
+    update_response = await async_client.put(
+        PROPERTY_MANAGER_DETAIL.format(pm_id=pm_id_to_update),
         json=update_data,
-        headers=headers
+        headers=s.primary_headers
     )
-    assert update_response.status_code == 200, update_response.json()
-    data = update_response.json()
-    assert data["role"] == "高级小区管理员"
-    assert data["community_id"] == db_community2.id
+    assert update_response.status_code == 200, rjson(update_response)
+    data = rjson(update_response)
+    assert {"role": "高级小区管理员", "community_id": db_community2.id}.items() <= data.items()
     assert data["community"]["id"] == db_community2.id
 
 # 测试移除物业管理员
-def test_remove_property_manager(client: TestClient, db: Session):
-    # 创建主要管理员和物业
-    primary_manager_user, primary_token = create_user_with_role(db, UserRole.PROPERTY)
-    property_in = PropertyCreate(
-        name="测试物业_rem_pm",
-        address="测试地址_rem_pm",
-        contact_name="测试联系人",
-        contact_phone="13800001114",
-    )
-    db_property = crud_property_module.create_with_manager(db, obj_in=property_in, manager_id=primary_manager_user.id)
+async def test_remove_property_manager(async_client: AsyncClient, pm_scaffold):
+    s = pm_scaffold
 
-    # 创建一个小区用于关联
-    db_community = crud_community_module.create_with_property(db, obj_in=CommunityCreate(name="小区_rem_pm", address="地址_rem_pm"), property_id=db_property.id)
-    
-    # 创建新的普通管理员用户并添加
-    new_ordinary_manager_user, _ = create_user_with_role(db, UserRole.PROPERTY)
-    
-    add_manager_data = {
-        "manager_id": new_ordinary_manager_user.id,
-        "role": "待移除管理员",
-        "is_primary": False,
-        "community_id": db_community.id
-    }
-    headers = {"Authorization": f"Bearer {primary_token}"}
-    add_response = client.post(
-        f"/api/v1/properties/{db_property.id}/managers",
-        json=add_manager_data,
-        headers=headers
-    )
-    assert add_response.status_code == 200, add_response.json()
-    pm_id_to_remove = add_response.json()["id"]
+    add_response = await add_manager(async_client, s, "待移除管理员", s.community.id)
+    assert add_response.status_code == 201, rjson(add_response)
+    pm_id_to_remove = rjson(add_response)["id"]
     
     # 测试移除管理员
-    remove_response = client.delete(
-        f"/api/v1/properties/{db_property.id}/managers/{pm_id_to_remove}",
-        headers=headers
-    )
-    assert remove_response.status_code == 200, remove_response.json()
-
-# ============ 运输API测试 ============
-
-# 测试创建运输信息
-def test_create_transport(client: TestClient, db: Session):
-    # 创建运输用户
-    transport_user, token = create_user_with_role(db, UserRole.TRANSPORT)
-    
-    # 测试创建运输信息
-    transport_data = {
-        "driver_name": "测试司机",
-        "driver_phone": "13800002222",
-        "driver_license": "123456789",
-        "vehicle_plate": "京A12345",
-        "vehicle_capacity": 10.0,
-        "vehicle_volume": 20.0
-    }
-
-
-    
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.post("/api/v1/transports/", json=transport_data, headers=headers)
-    assert response.status_code == 201
-    transport_data = response.json()
-    assert transport_data["driver_name"] == "测试司机"
-    assert transport_data["vehicle_plate"] == "京A12345"
-
-# 测试获取运输列表
-def test_read_transports(client: TestClient, db: Session):
-    # 创建运输用户和运输信息
-    transport_user, token = create_user_with_role(db, UserRole.TRANSPORT)
-    transport_in = TransportCreate(
-        driver_name="测试司机",
-        driver_phone="13800002222",
-        driver_license="123456789",
-        vehicle_plate="京A12345",
-        vehicle_capacity=10.0,
-        vehicle_volume=20.0
+    remove_response = await async_client.delete(
+        PROPERTY_MANAGER_DETAIL.format(pm_id=pm_id_to_remove),
+        headers=s.primary_headers
     )
-    db_transport = transport.create_with_manager(db, obj_in=transport_in, manager_id=transport_user.id)
-    
-    # 测试获取运输列表
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/api/v1/transports/", headers=headers)
-    assert response.status_code == 200
-    transports_data = response.json()
-    assert isinstance(transports_data, list)
-    assert len(transports_data) > 0
-
-# 测试更新司机状态
-def test_update_driver_status(client: TestClient, db: Session):
-    # 创建运输用户和运输信息
-    transport_user, token = create_user_with_role(db, UserRole.TRANSPORT)
-    transport_in = TransportCreate(
-        driver_name="测试司机",
-        driver_phone="13800002222",
-        driver_license="123456789",
-        vehicle_plate="京A12345",
-        vehicle_capacity=10.0,
-        vehicle_volume=20.0
-    )
-    db_transport = transport.create_with_manager(db, obj_in=transport_in, manager_id=transport_user.id)
-    status_update = {
-        "status": DriverStatus.BUSY
-    }
-    # 测试更新司机状态
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.put(f"/api/v1/transports/{db_transport.id}/status", json=status_update, headers=headers)
-    assert response.status_code == 200
-    transport_data = response.json()
-    assert transport_data["driver_status"] == DriverStatus.BUSY
-
-# ============ 回收站API测试 ============
-
-# 测试创建回收站信息
-def test_create_recycling(client: TestClient, db: Session):
-    # 创建回收站用户
-    recycling_user, token = create_user_with_role(db, UserRole.RECYCLING)
-    
-    # 测试创建回收站信息
-    recycling_data = {
-        "name": "测试回收站",
-        "address": "测试地址",
-        "contact_name": "测试联系人",
-        "contact_phone": "13800003333",
-        "capacity": 100.0
-    }
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.post("/api/v1/recyclings/", json=recycling_data, headers=headers)
-    assert response.status_code == 201
-    recycling_data = response.json()
-    assert recycling_data["name"] == "测试回收站"
-    assert recycling_data["capacity"] == 100.0
-
-# 测试获取回收站列表
-def test_read_recyclings(client: TestClient, db: Session):
-    # 创建回收站用户和回收站信息
-    recycling_user, token = create_user_with_role(db, UserRole.RECYCLING)
-    recycling_in = RecyclingCreate(
-        name="测试回收站",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800003333",
-        capacity=100.0
-    )
-    db_recycling = recycling.create_with_manager(db, obj_in=recycling_in, manager_id=recycling_user.id)
-    
-    # 测试获取回收站列表
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/api/v1/recyclings/", headers=headers)
-    assert response.status_code == 200
-    recyclings_data = response.json()
-    assert isinstance(recyclings_data, list)
-    assert len(recyclings_data) > 0
-
-# 测试更新回收站状态
-def test_update_recycling_status(client: TestClient, db: Session):
-    # 创建回收站用户和回收站信息
-    recycling_user, token = create_user_with_role(db, UserRole.RECYCLING)
-    recycling_in = RecyclingCreate(
-        name="测试回收站",
-        address="测试地址",
-        contact_name="测试联系人",
-        contact_phone="13800003333",
-        capacity=100.0
-    )
-    db_recycling = recycling.create_with_manager(db, obj_in=recycling_in, manager_id=recycling_user.id)
-    
-    # 测试更新回收站状态
-    headers = {"Authorization": f"Bearer {token}"}
-    status_update = {
-        "status": RecyclingStatus.MAINTENANCE
-    }
-    response = client.put(f"/api/v1/recyclings/{db_recycling.id}/status", json=status_update, headers=headers)
-    assert response.status_code == 200
-    recycling_data = response.json()
-    assert recycling_data["status"] == RecyclingStatus.MAINTENANCE
\ No newline at end of file
+    assert remove_response.status_code == 204
+
+# ============ 物业公司/回收公司通用测试 ============
+
+# 测试创建资源，创建者应被记录为管理员
+@pytest.mark.parametrize("role_user,endpoint,payload,body,checked_fields,managers_field", [
+    pytest.param(UserRole.PROPERTY, PROPERTIES, PROPERTY_PAYLOAD, PROPERTY_BODY,
+                 ("name", "address", "contact_name", "contact_phone"), "property_managers", id="property"),
+    pytest.param(UserRole.RECYCLING, RECYCLINGS, RECYCLING_PAYLOAD, RECYCLING_BODY,
+                 ("name", "capacity_tons_per_day"), "recycling_managers", id="recycling"),
+], indirect=["role_user"])
+async def test_create_resource(async_client: AsyncClient, db: Session, role_user, endpoint, payload, body, checked_fields, managers_field):
+    owner, headers = role_user
+    response = await async_client.post(endpoint, content=body, headers={**headers, **JSON_HEADERS})
+    assert response.status_code == 201, response.text
+    data = rjson(response)
+    assert {field: payload[field] for field in checked_fields}.items() <= data.items()
+    assert len(data[managers_field]) == 1
+    assert data[managers_field][0]["manager_id"] == owner.id
+    assert data[managers_field][0]["is_primary"] == True
+
+# 测试获取资源列表
+@pytest.mark.parametrize("role_user,endpoint,create_fn,obj_in", [
+    pytest.param(UserRole.PROPERTY, PROPERTIES,
+                 lambda db, obj_in, manager_id: crud_property_company.create_with_primary_manager(db, obj_in=obj_in, manager_user_id=manager_id),
+                 PROPERTY_IN, id="property"),
+    pytest.param(UserRole.RECYCLING, RECYCLINGS,
+                 lambda db, obj_in, manager_id: recycling_company.create_with_primary_manager(db, obj_in=obj_in, primary_manager_user_id=manager_id),
+                 RECYCLING_IN, id="recycling"),
+], indirect=["role_user"])
+async def test_read_resources(async_client: AsyncClient, db: Session, role_user, endpoint, create_fn, obj_in):
+    owner, headers = role_user
+    db_obj = create_fn(db, obj_in=obj_in, manager_id=owner.id)
+    # 列表只返回当前用户管理的公司，只请求一条即可
+    response = await async_client.get(endpoint, params={"skip": 0, "limit": 1}, headers=headers)
+    assert response.status_code == 200, response.text
+    data = rjson(response)
+    assert isinstance(data, list)
+    assert [item["id"] for item in data] == [db_obj.id]
+
+# 测试更新回收公司运营状态
+@pytest.mark.parametrize("role_user", [UserRole.RECYCLING], indirect=True)
+async def test_update_resource_status(async_client: AsyncClient, db: Session, role_user):
+    owner, headers = role_user
+    db_obj = recycling_company.create_with_primary_manager(db, obj_in=RECYCLING_IN, primary_manager_user_id=owner.id)
+    new_status = RecyclingCompanyStatus.MAINTENANCE.value
+    response = await async_client.put(f"{RECYCLINGS}{db_obj.id}/status", json={"status": new_status}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert rjson(response)["status"] == new_status
@@ -1,97 +1,68 @@
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import EmailStr, TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
 from app.crud.crud_user import user
-from app.schemas.user import UserCreate, UserUpdate
-from app.models.user import UserRole
-from app.core.security import create_access_token
+from app.schemas.user import UserCreate, UserUpdate, _validate_email
+from app.models.user import User, UserRole
 
-# 辅助函数：创建测试用户并返回token
-def create_test_user_and_token(db: Session, is_superuser=False):
-    user_in = UserCreate(
-        username="testuser",
-        email="testuser@example.com",
-        phone="13800001111",
-        password="testpassword",
-        full_name="测试用户",
-        role=UserRole.CUSTOMER,
-        is_superuser=is_superuser
-    )
-    db_user = user.create(db, obj_in=user_in)
-    access_token = create_access_token(db_user.id)
-    return db_user, access_token
+@pytest.fixture
+def customer_user(user_factory) -> tuple[User, dict]:
+    """普通客户用户"""
+    return user_factory(UserRole.CUSTOMER)
+
+@pytest.fixture
+def admin_user(user_factory) -> tuple[User, dict]:
+    """超级管理员用户"""
+    return user_factory(UserRole.CUSTOMER, is_superuser=True)
+
+@pytest.fixture
+def acting_user(request, user_factory) -> tuple[User, dict]:
+    """间接参数化使用：request.param 为是否超级管理员"""
+    return user_factory(UserRole.CUSTOMER, is_superuser=request.param)
 
 # 测试获取当前用户信息
-def test_read_user_me(client: TestClient, db: Session):
-    # 创建测试用户和token
-    db_user, access_token = create_test_user_and_token(db)
-    
+def test_read_user_me(client: TestClient, customer_user):
+    db_user, headers = customer_user
+
     # 测试获取当前用户信息
-    headers = {"Authorization": f"Bearer {access_token}"}
     response = client.get("/api/v1/users/me", headers=headers)
     assert response.status_code == 200
     user_data = response.json()
-    assert user_data["username"] == "testuser"
-    assert user_data["email"] == "testuser@example.com"
+    assert user_data["username"] == db_user.username
+    assert user_data["email"] == db_user.email
 
-# 测试更新当前用户信息
-def test_update_user_me(client: TestClient, db: Session):
-    # 创建测试用户和token
-    db_user, access_token = create_test_user_and_token(db)
-    
-    # 测试更新当前用户信息
-    update_data = {
-        "full_name": "更新后的用户名",
-        "email": "updated@example.com"
-    }
-    headers = {"Authorization": f"Bearer {access_token}"}
-    response = client.put("/api/v1/users/me", json=update_data, headers=headers)
-    assert response.status_code == 200
-    user_data = response.json()
-    assert user_data["full_name"] == "更新后的用户名"
-    assert user_data["email"] == "updated@example.com"
+# 测试更新当前用户信息：普通字段可以改，角色不能由本人修改
+@pytest.mark.parametrize("update_data,expected_status", [
+    pytest.param({"full_name": "更新后的用户名", "email": "updated@example.com"}, 200, id="profile"),
+    pytest.param({"role": UserRole.PROPERTY}, 400, id="role_forbidden"),
+])
+def test_update_user_me(client: TestClient, customer_user, update_data, expected_status):
+    _, headers = customer_user
 
-# 测试普通用户无法修改自己的角色
-def test_update_user_me_role_forbidden(client: TestClient, db: Session):
-    # 创建测试用户和token
-    db_user, access_token = create_test_user_and_token(db)
-    
-    # 测试普通用户尝试修改自己的角色
-    update_data = {
-        "role": UserRole.PROPERTY
-    }
-    headers = {"Authorization": f"Bearer {access_token}"}
     response = client.put("/api/v1/users/me", json=update_data, headers=headers)
-    assert response.status_code == 400
+    assert response.status_code == expected_status
+    if expected_status == 200:
+        assert update_data.items() <= response.json().items()
 
-# 测试管理员获取所有用户列表
-def test_read_users(client: TestClient, db: Session):
-    # 创建管理员用户和token
-    db_user, access_token = create_test_user_and_token(db, is_superuser=True)
-    
-    # 测试获取所有用户列表
-    headers = {"Authorization": f"Bearer {access_token}"}
-    response = client.get("/api/v1/users/", headers=headers)
-    assert response.status_code == 200
-    users_data = response.json()
-    assert isinstance(users_data, list)
+# 测试获取所有用户列表：仅管理员可以
+@pytest.mark.parametrize("acting_user,expected_status", [
+    pytest.param(True, 200, id="admin"),
+    pytest.param(False, 403, id="forbidden"),
+], indirect=["acting_user"])
+def test_read_users(client: TestClient, acting_user, expected_status):
+    _, headers = acting_user
 
-# 测试普通用户无法获取所有用户列表
-def test_read_users_forbidden(client: TestClient, db: Session):
-    # 创建普通用户和token
-    db_user, access_token = create_test_user_and_token(db)
-    
-    # 测试普通用户尝试获取所有用户列表
-    headers = {"Authorization": f"Bearer {access_token}"}
     response = client.get("/api/v1/users/", headers=headers)
-    assert response.status_code == 403
+    assert response.status_code == expected_status
+    if expected_status == 200:
+        assert isinstance(response.json(), list)
 
 # 测试管理员创建新用户
-def test_create_user(client: TestClient, db: Session):
-    # 创建管理员用户和token
-    db_user, access_token = create_test_user_and_token(db, is_superuser=True)
-    
+def test_create_user(client: TestClient, admin_user):
+    _, headers = admin_user
+
     # 测试创建新用户
     new_user_data = {
         "username": "newuser",
@@ -101,7 +72,6 @@ def test_create_user(client: TestClient, db: Session):
         "full_name": "新用户",
         "role": UserRole.PROPERTY
     }
-    headers = {"Authorization": f"Bearer {access_token}"}
     response = client.post("/api/v1/users/", json=new_user_data, headers=headers)
     assert response.status_code == 201
     user_data = response.json()
@@ -109,9 +79,8 @@ def test_create_user(client: TestClient, db: Session):
     assert user_data["role"] == UserRole.PROPERTY
 
 # 测试管理员获取特定用户信息
-def test_read_user(client: TestClient, db: Session):
-    # 创建管理员用户和token
-    admin_user, admin_token = create_test_user_and_token(db, is_superuser=True)
+def test_read_user(client: TestClient, db: Session, admin_user):
+    _, headers = admin_user
     
     # 创建普通用户
     user_in = UserCreate(
@@ -125,7 +94,6 @@ def test_read_user(client: TestClient, db: Session):
     db_user = user.create(db, obj_in=user_in)
     
     # 测试获取特定用户信息
-    headers = {"Authorization": f"Bearer {admin_token}"}
     response = client.get(f"/api/v1/users/{db_user.id}", headers=headers)
     assert response.status_code == 200
     user_data = response.json()
@@ -133,9 +101,8 @@ def test_read_user(client: TestClient, db: Session):
     assert user_data["email"] == "usertoread@example.com"
 
 # 测试管理员更新特定用户信息
-def test_update_user(client: TestClient, db: Session):
-    # 创建管理员用户和token
-    admin_user, admin_token = create_test_user_and_token(db, is_superuser=True)
+def test_update_user(client: TestClient, db: Session, admin_user):
+    _, headers = admin_user
     
     # 创建普通用户
     user_in = UserCreate(
@@ -153,9 +120,39 @@ def test_update_user(client: TestClient, db: Session):
         "full_name": "已更新用户",
         "role": UserRole.PROPERTY
     }
-    headers = {"Authorization": f"Bearer {admin_token}"}
     response = client.put(f"/api/v1/users/{db_user.id}", json=update_data, headers=headers)
     assert response.status_code == 200
     user_data = response.json()
     assert user_data["full_name"] == "已更新用户"
-    assert user_data["role"] == UserRole.PROPERTY
\ No newline at end of file
+    assert user_data["role"] == UserRole.PROPERTY
+
+# 邮箱快路径的接受/拒绝结果及规范化输出必须与 EmailStr 一致
+_EMAIL_STR = TypeAdapter(EmailStr)
+
+@pytest.mark.parametrize("value", [
+    "User@Example.COM",
+    "a.b+c@sub.example.org",
+    "a_b%c@x.io",
+    "a@" + "b" * 63 + ".com",
+    "a@" + "b" * 64 + ".com",
+    "x@xn--abc.com",
+    "x@xn--bcher-kva.com",
+    "x@ab--c.com",
+    "x@a--b.com",
+    "a@foo.test",
+    "a@localhost",
+    "a..b@x.com",
+    "a@-x.com",
+    "a@x.co1",
+    "a@123.com",
+])
+def test_email_fast_path_matches_email_str(value):
+    try:
+        expected = _EMAIL_STR.validate_python(value)
+    except ValidationError:
+        expected = None
+    try:
+        actual = _validate_email(value)
+    except ValueError:
+        actual = None
+    assert actual == expected